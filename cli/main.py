@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 import datetime
+import json
 import typer
 from pathlib import Path
 from functools import wraps
@@ -19,6 +20,7 @@ from rich.tree import Tree
 from rich import box
 from rich.align import Align
 from rich.rule import Rule
+from langchain_core.messages import AIMessageChunk
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
@@ -79,6 +81,19 @@ class MessageBuffer:
             "trader_investment_plan": None,
             "final_trade_decision": None,
         }
+        # Partial output of the node whose LLM tokens are being streamed
+        self.streaming_node = None
+        self.streaming_content = ""
+
+    def append_stream_chunk(self, node, text):
+        if node != self.streaming_node:
+            self.streaming_node = node
+            self.streaming_content = ""
+        self.streaming_content += text
+
+    def end_stream(self):
+        self.streaming_node = None
+        self.streaming_content = ""
 
     def add_message(self, message_type, content):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
@@ -362,8 +377,18 @@ def update_display(layout, spinner_text=None):
         )
     )
 
-    # Analysis panel showing current report
-    if message_buffer.current_report:
+    # Analysis panel showing the output being streamed, else the current report
+    if message_buffer.streaming_node:
+        # only the tail fits the panel, and re-rendering it stays cheap
+        layout["analysis"].update(
+            Panel(
+                Markdown(message_buffer.streaming_content[-STREAM_TAIL_CHARS:]),
+                title=f"{message_buffer.streaming_node} (streaming...)",
+                border_style="yellow",
+                padding=(1, 2),
+            )
+        )
+    elif message_buffer.current_report:
         layout["analysis"].update(
             Panel(
                 Markdown(message_buffer.current_report),
@@ -400,6 +425,30 @@ def update_display(layout, spinner_text=None):
     layout["footer"].update(Panel(stats_table, border_style="grey50"))
 
 
+# Characters of a streamed output shown in the analysis panel
+STREAM_TAIL_CHARS = 3000
+# Minimum seconds between display updates while tokens stream in
+STREAM_REFRESH_INTERVAL = 0.1
+_last_stream_refresh = 0.0
+
+
+def update_stream_display(layout, message_chunk, metadata):
+    """Append a streamed LLM token chunk to the buffer and refresh the display."""
+    global _last_stream_refresh
+
+    if not isinstance(message_chunk, AIMessageChunk):
+        return
+    text = extract_content_string(message_chunk.content)
+    if not text:
+        return
+    message_buffer.append_stream_chunk(metadata.get("langgraph_node"), text)
+
+    now = time.monotonic()
+    if now - _last_stream_refresh >= STREAM_REFRESH_INTERVAL:
+        _last_stream_refresh = now
+        update_display(layout)
+
+
 def get_user_selections():
     """Get all user selections before starting the analysis display."""
     # Step 0: Language selection (FIRST!)
@@ -761,6 +810,50 @@ def display_complete_report(final_state):
             )
 
 
+def display_run_metrics(run_metrics):
+    """Display the per-node time, token and cost breakdown of a run."""
+    table = Table(title="Run Metrics by Node", box=box.SIMPLE_HEAD)
+    table.add_column("Node", style="cyan")
+    table.add_column("Runs", justify="right")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("LLM calls", justify="right")
+    table.add_column("Cache hits", justify="right")
+    table.add_column("Prompt tok", justify="right")
+    table.add_column("Compl. tok", justify="right")
+    table.add_column("Cost ($)", justify="right")
+    table.add_column("Tool calls", justify="right")
+    table.add_column("Tool KB", justify="right")
+    table.add_column("Retries", justify="right")
+    table.add_column("Errors", justify="right")
+
+    def add_row(name, metrics, **kwargs):
+        table.add_row(
+            name,
+            str(metrics["calls"]),
+            f"{metrics['wall_seconds']:.1f}",
+            str(metrics["llm_calls"]),
+            str(metrics["cache_hits"]),
+            f"{metrics['prompt_tokens']:,}",
+            f"{metrics['completion_tokens']:,}",
+            f"{metrics['cost_usd']:.4f}",
+            str(metrics["tool_calls"]),
+            f"{(metrics['tool_input_bytes'] + metrics['tool_output_bytes']) / 1024:.1f}",
+            str(metrics["retries"]),
+            str(metrics["errors"]),
+            **kwargs,
+        )
+
+    # most expensive nodes first
+    nodes = sorted(
+        run_metrics["nodes"].items(), key=lambda item: -item[1]["wall_seconds"]
+    )
+    for node, metrics in nodes:
+        add_row(node, metrics)
+    table.add_section()
+    add_row("Total", run_metrics["total"], style="bold")
+    console.print(table)
+
+
 def update_research_team_status(status):
     """Update status for all research team members and trader."""
     research_team = ["Bull Researcher", "Bear Researcher", "Research Manager", "Trader"]
@@ -894,11 +987,25 @@ def run_analysis():
         init_agent_state = graph.propagator.create_initial_state(
             selections["ticker"], selections["analysis_date"]
         )
-        args = graph.propagator.get_graph_args()
+        instrumentation = graph.create_instrumentation()
+        stream_tokens = config.get("stream_llm_tokens", False)
+        args = graph.propagator.get_graph_args(
+            callbacks=[instrumentation], stream_tokens=stream_tokens
+        )
 
         # Stream the analysis
         trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
+        for stream_item in graph.graph.stream(init_agent_state, **args):
+            if stream_tokens:
+                stream_mode, chunk = stream_item
+                if stream_mode == "messages":
+                    # tokens of the running node, shown until the node completes
+                    update_stream_display(layout, *chunk)
+                    continue
+                message_buffer.end_stream()
+            else:
+                chunk = stream_item
+
             if len(chunk["messages"]) > 0:
                 # Get the last message from the chunk
                 last_message = chunk["messages"][-1]
@@ -1130,6 +1237,9 @@ def run_analysis():
 
         # Get final state and decision
         final_state = trace[-1]
+        final_state["run_metrics"] = instrumentation.summary()
+        with open(report_dir / "run_metrics.json", "w", encoding='utf-8') as f:
+            json.dump(final_state["run_metrics"], f, indent=4)
         decision = graph.process_signal(final_state["final_trade_decision"])
 
         # Update all agent statuses to completed
@@ -1147,6 +1257,7 @@ def run_analysis():
 
         # Display the complete final report
         display_complete_report(final_state)
+        display_run_metrics(final_state["run_metrics"])
 
         update_display(layout)
 
@@ -1237,5 +1348,85 @@ def analyze():
     run_analysis()
 
 
+@app.command()
+def prefetch(
+    tickers: Optional[List[str]] = typer.Argument(
+        None, help="Ticker symbols to prefetch, e.g. SPY NVDA AAPL"
+    ),
+    watchlist: Optional[Path] = typer.Option(
+        None, "--watchlist", "-w", help="File with one ticker per line"
+    ),
+    batch_size: int = typer.Option(
+        50, "--batch-size", "-b", help="Tickers per multi-symbol download"
+    ),
+    indicators: bool = typer.Option(
+        True, "--indicators/--no-indicators", help="Also materialize indicators"
+    ),
+):
+    """Warm the local price cache for a universe of tickers before a run."""
+    from tradingagents.dataflows import load_watchlist, prefetch_universe
+
+    symbols = list(tickers or [])
+    if watchlist is not None:
+        symbols.extend(load_watchlist(str(watchlist)))
+    if not symbols:
+        console.print("[red]No tickers given. Pass tickers or --watchlist.[/red]")
+        raise typer.Exit(code=1)
+
+    with console.status(f"Prefetching price history for {len(symbols)} tickers..."):
+        summary = prefetch_universe(
+            symbols, batch_size=batch_size, materialize_indicators=indicators
+        )
+
+    table = Table(title="Price Cache", box=box.SIMPLE_HEAD)
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Daily bars", justify="right")
+    for symbol, rows in summary.items():
+        table.add_row(symbol, str(rows) if rows else "[red]no data[/red]")
+    console.print(table)
+
+
+@app.command("partition-finnhub")
+def partition_finnhub(
+    data_dir: Optional[Path] = typer.Option(
+        None, "--data-dir", help="Data directory holding finnhub_data/"
+    ),
+):
+    """Split the Finnhub data files into per-ticker, per-month partitions."""
+    from tradingagents.dataflows import partition_finnhub_data
+
+    data_dir = str(data_dir or DEFAULT_CONFIG["data_dir"])
+    with console.status("Partitioning Finnhub data..."):
+        converted = partition_finnhub_data(data_dir)
+
+    table = Table(title="Finnhub Partitions", box=box.SIMPLE_HEAD)
+    table.add_column("Data type", style="cyan")
+    table.add_column("Files repartitioned", justify="right")
+    for data_type, count in converted.items():
+        table.add_row(data_type, str(count))
+    console.print(table)
+
+
+@app.command("index-reddit")
+def index_reddit(
+    data_dir: Optional[Path] = typer.Option(
+        None, "--data-dir", help="Data directory holding reddit_data/"
+    ),
+):
+    """Index the Reddit JSONL files by day so each day's fetch reads only its posts."""
+    from tradingagents.dataflows import build_reddit_index
+
+    data_dir = Path(data_dir or DEFAULT_CONFIG["data_dir"])
+    with console.status("Indexing Reddit data..."):
+        indexed = build_reddit_index(str(data_dir / "reddit_data"))
+
+    table = Table(title="Reddit Index", box=box.SIMPLE_HEAD)
+    table.add_column("Category", style="cyan")
+    table.add_column("Files indexed", justify="right")
+    for category, count in indexed.items():
+        table.add_row(category, str(count))
+    console.print(table)
+
+
 if __name__ == "__main__":
     app()
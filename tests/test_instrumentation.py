@@ -0,0 +1,145 @@
+import json
+from typing import Annotated, TypedDict
+
+import httpx
+import pytest
+from langchain_core.messages import AnyMessage, HumanMessage
+from langchain_openai import ChatOpenAI
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph import trading_graph
+from tradingagents.graph.instrumentation import RunInstrumentation
+
+PROMPT_TOKENS = 12
+COMPLETION_TOKENS = 3
+
+
+def _sse_chunk(payload):
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def _chat_completions(request: httpx.Request) -> httpx.Response:
+    """Stream a two-token answer, with a usage chunk only when asked for one."""
+    body = json.loads(request.content)
+    assert body["stream"]
+
+    chunk = {
+        "id": "chatcmpl-test",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "gpt-4o-mini-2024-07-18",
+    }
+    events = [
+        _sse_chunk(
+            {
+                **chunk,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"role": "assistant", "content": text},
+                        "finish_reason": None,
+                    }
+                ],
+            }
+        )
+        for text in ("HO", "LD")
+    ]
+    events.append(
+        _sse_chunk(
+            {
+                **chunk,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+        )
+    )
+    if body.get("stream_options", {}).get("include_usage"):
+        events.append(
+            _sse_chunk(
+                {
+                    **chunk,
+                    "choices": [],
+                    "usage": {
+                        "prompt_tokens": PROMPT_TOKENS,
+                        "completion_tokens": COMPLETION_TOKENS,
+                        "total_tokens": PROMPT_TOKENS + COMPLETION_TOKENS,
+                    },
+                }
+            )
+        )
+    events.append("data: [DONE]\n\n")
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        content="".join(events).encode("utf-8"),
+    )
+
+
+class _State(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+
+
+def _stream_run():
+    """Stream one LLM node the way the CLI does and return its metrics."""
+    llm = ChatOpenAI(
+        model="gpt-4o-mini",
+        base_url="http://backend.test/v1",
+        api_key="test",
+        stream_usage=True,
+        http_client=httpx.Client(transport=httpx.MockTransport(_chat_completions)),
+    )
+
+    def trader(state):
+        return {"messages": [llm.invoke(state["messages"])]}
+
+    builder = StateGraph(_State)
+    builder.add_node("Trader", trader)
+    builder.add_edge(START, "Trader")
+    builder.add_edge("Trader", END)
+    graph = builder.compile()
+
+    instrumentation = RunInstrumentation({"gpt-4o-mini": (0.15, 0.6)})
+    tokens = []
+    for mode, item in graph.stream(
+        {"messages": [HumanMessage("BUY, SELL or HOLD?")]},
+        stream_mode=["values", "messages"],
+        config={"callbacks": [instrumentation]},
+    ):
+        if mode == "messages":
+            tokens.append(item[0].content)
+    assert "".join(tokens) == "HOLD"
+    return instrumentation.summary()
+
+
+def test_streamed_run_counts_tokens_and_cost():
+    metrics = _stream_run()["nodes"]["Trader"]
+
+    assert metrics["calls"] == 1
+    assert metrics["llm_calls"] == 1
+    assert metrics["prompt_tokens"] == PROMPT_TOKENS
+    assert metrics["completion_tokens"] == COMPLETION_TOKENS
+    assert metrics["cost_usd"] > 0
+
+
+@pytest.mark.parametrize("stream_llm_tokens", [True, False])
+def test_graph_llms_stream_usage_when_streaming(
+    monkeypatch, tmp_path, stream_llm_tokens
+):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    # the memories' vector store is not under test
+    monkeypatch.setattr(
+        trading_graph, "FinancialSituationMemory", lambda name, config: None
+    )
+    config = dict(
+        DEFAULT_CONFIG,
+        project_dir=str(tmp_path),
+        llm_provider="openai",
+        llm_cache_mode=None,
+        stream_llm_tokens=stream_llm_tokens,
+    )
+
+    graph = trading_graph.TradingAgentsGraph(config=config)
+
+    assert graph.deep_thinking_llm.stream_usage is stream_llm_tokens
+    assert graph.quick_thinking_llm.stream_usage is stream_llm_tokens
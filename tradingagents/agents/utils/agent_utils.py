@@ -3,7 +3,7 @@ from typing import List
 from typing import Annotated
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import RemoveMessage
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool, tool
 from datetime import date, timedelta, datetime
 import functools
 import pandas as pd
@@ -31,6 +31,41 @@ def create_msg_delete():
     return delete_messages
 
 
+# Async counterparts of the network-bound tools. A ToolNode run under
+# graph.ainvoke awaits these instead of blocking on each request in turn, so
+# the tool calls of one agent overlap their I/O over the shared client pools.
+async def _aget_YFin_data_online(symbol: str, start_date: str, end_date: str) -> str:
+    return await interface.aget_YFin_data_online(symbol, start_date, end_date)
+
+
+async def _aget_google_news(query: str, curr_date: str) -> str:
+    return await interface.aget_google_news(query, curr_date, 7)
+
+
+async def _aget_stock_news_openai(ticker: str, curr_date: str) -> str:
+    return await interface.aget_stock_news_openai(ticker, curr_date)
+
+
+async def _aget_global_news_openai(curr_date: str) -> str:
+    return await interface.aget_global_news_openai(curr_date)
+
+
+async def _aget_fundamentals_openai(ticker: str, curr_date: str) -> str:
+    return await interface.aget_fundamentals_openai(ticker, curr_date)
+
+
+def tool_with_coroutine(coroutine):
+    """
+    Like @tool, but the tool also gets an async implementation, which a
+    ToolNode run under graph.ainvoke awaits instead of the sync function.
+    """
+
+    def decorator(func):
+        return StructuredTool.from_function(func=func, coroutine=coroutine)
+
+    return decorator
+
+
 class Toolkit:
     _config = DEFAULT_CONFIG.copy()
 
@@ -141,7 +176,7 @@ class Toolkit:
         return result_data
 
     @staticmethod
-    @tool
+    @tool_with_coroutine(_aget_YFin_data_online)
     def get_YFin_data_online(
         symbol: Annotated[str, "ticker symbol of the company"],
         start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -219,6 +254,64 @@ class Toolkit:
 
         return result_stockstats
 
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in a single call.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A date x indicator table with the values of every requested indicator for the specified ticker symbol.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_table(
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in a single call.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A date x indicator table with the values of every requested indicator for the specified ticker symbol.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_table(
+            symbol, indicators, curr_date, look_back_days, True
+        )
+
+        return result_stockstats
+
     @staticmethod
     @tool
     def get_finnhub_company_insider_sentiment(
@@ -343,6 +436,58 @@ class Toolkit:
 
     @staticmethod
     @tool
+    def get_simfin_fundamentals_snapshot(
+        ticker: Annotated[str, "ticker symbol"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve the most recent balance sheet, cash flow statement and income statement of a company in one call
+        Args:
+            ticker (str): ticker symbol of the company
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+            str: a report of the company's three most recent financial statements as of curr_date
+        """
+
+        data_snapshot = interface.get_simfin_fundamentals_snapshot(
+            ticker, freq, curr_date
+        )
+
+        return data_snapshot
+
+    @staticmethod
+    @tool
+    def get_simfin_fundamentals_screen(
+        tickers: Annotated[List[str], "ticker symbols to screen"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve the most recent balance sheet, cash flow statement and income statement for several companies in one call
+        Args:
+            tickers (List[str]): ticker symbols of the companies to screen
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+            str: one report per company of its three most recent financial statements as of curr_date
+        """
+
+        data_screen = interface.get_simfin_fundamentals_screen(
+            tickers, freq, curr_date
+        )
+
+        return data_screen
+
+    @staticmethod
+    @tool_with_coroutine(_aget_google_news)
     def get_google_news(
         query: Annotated[str, "Query to search with"],
         curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -362,7 +507,7 @@ class Toolkit:
         return google_news_results
 
     @staticmethod
-    @tool
+    @tool_with_coroutine(_aget_stock_news_openai)
     def get_stock_news_openai(
         ticker: Annotated[str, "the company's ticker"],
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -381,7 +526,7 @@ class Toolkit:
         return openai_news_results
 
     @staticmethod
-    @tool
+    @tool_with_coroutine(_aget_global_news_openai)
     def get_global_news_openai(
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     ):
@@ -398,7 +543,7 @@ class Toolkit:
         return openai_news_results
 
     @staticmethod
-    @tool
+    @tool_with_coroutine(_aget_fundamentals_openai)
     def get_fundamentals_openai(
         ticker: Annotated[str, "the company's ticker"],
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -1,8 +1,23 @@
-from .finnhub_utils import get_data_in_range
+from .finnhub_utils import get_data_in_range, partition_finnhub_data
 from .googlenews_utils import getNewsData
 from .yfin_utils import YFinanceUtils
-from .reddit_utils import fetch_top_from_category
+from .reddit_utils import (
+    fetch_top_from_category,
+    fetch_top_from_category_range,
+    build_reddit_index,
+)
 from .stockstats_utils import StockstatsUtils
+from .price_store import PriceStore, get_price_store
+from .frame_cache import FrameCache, get_frame_cache
+from .yfin_cache import YFinHistoryCache, get_yfin_history_cache
+from .trading_calendar import TradingCalendar, get_trading_calendar
+from .indicator_store import IndicatorStore, get_indicator_store
+from .fundamentals_store import FundamentalsStore, get_fundamentals_store
+from .news_cache import NewsCache, get_news_cache
+from .jsonl_utils import JsonlDecoder, get_jsonl_decoder, benchmark_jsonl_decoders
+from .openai_clients import get_openai_client, close_openai_clients
+from .async_utils import aclose_clients, get_http_client, run_blocking
+from .prefetch import load_watchlist, prefetch_universe
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -17,12 +32,21 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_simfin_fundamentals_snapshot,
+    get_simfin_fundamentals_screen,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_table,
     get_stockstats_indicator,
     # Market data functions
     get_YFin_data_window,
     get_YFin_data,
+    # Async variants of the online functions
+    aget_YFin_data_online,
+    aget_google_news,
+    aget_stock_news_openai,
+    aget_global_news_openai,
+    aget_fundamentals_openai,
 )
 
 __all__ = [
@@ -37,10 +61,19 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_fundamentals_snapshot",
+    "get_simfin_fundamentals_screen",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_table",
     "get_stockstats_indicator",
     # Market data functions
     "get_YFin_data_window",
     "get_YFin_data",
+    # Async variants of the online functions
+    "aget_YFin_data_online",
+    "aget_google_news",
+    "aget_stock_news_openai",
+    "aget_global_news_openai",
+    "aget_fundamentals_openai",
 ]
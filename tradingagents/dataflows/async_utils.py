@@ -0,0 +1,87 @@
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from .config import get_config
+from .openai_clients import client_key, openai_async_http_client
+
+# httpx/OpenAI async clients hold connections bound to the event loop they were
+# first used on, so the shared pools are kept per running loop.
+_http_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_openai_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool used for calls with no async API (yfinance)."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_config()["async_blocking_workers"],
+                thread_name_prefix="tradingagents-io",
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call on the shared thread pool without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_blocking_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the running loop's shared, connection-pooled httpx.AsyncClient."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _http_clients.get(loop)
+        if client is None or client.is_closed:
+            max_connections = get_config()["async_max_connections"]
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=httpx.Timeout(30.0),
+                follow_redirects=True,
+            )
+            _http_clients[loop] = client
+        return client
+
+
+def get_async_openai_client(
+    base_url: Optional[str] = None, api_key: Optional[str] = None
+) -> AsyncOpenAI:
+    """Return the running loop's shared AsyncOpenAI client for a backend and key."""
+    key = client_key(base_url, api_key)
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _openai_clients.setdefault(loop, {})
+        if key not in clients:
+            clients[key] = AsyncOpenAI(
+                base_url=key[0],
+                api_key=key[1],
+                http_client=openai_async_http_client(),
+            )
+        return clients[key]
+
+
+async def aclose_clients() -> None:
+    """Close the shared async clients of the running loop, e.g. before it exits."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        http_client = _http_clients.pop(loop, None)
+        openai_clients = _openai_clients.pop(loop, {})
+    if http_client is not None:
+        await http_client.aclose()
+    for client in openai_clients.values():
+        await client.close()
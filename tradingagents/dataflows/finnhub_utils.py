@@ -1,5 +1,141 @@
 import json
 import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+from .utils import atomic_write, file_stamp
+
+# How many parsed {ticker}_data_formatted.json files to keep in memory
+MAX_CACHED_FILES = 64
+
+# Per-ticker, per-month partitions of finnhub_data/<data_type>/ are written here
+PARTITIONED_DIR = "finnhub_data_partitioned"
+
+# data_path -> ((mtime_ns, size), sorted date keys, parsed data)
+_parsed_files = OrderedDict()
+_parsed_files_lock = threading.Lock()
+
+
+def _load_formatted(data_path):
+    """
+    Return the sorted date keys and parsed content of a formatted finnhub file.
+    The parse is cached and redone only when the file's mtime or size changes.
+    """
+    stamp = file_stamp(data_path)
+
+    with _parsed_files_lock:
+        cached = _parsed_files.get(data_path)
+        if cached is not None and cached[0] == stamp:
+            _parsed_files.move_to_end(data_path)
+            return cached[1], cached[2]
+
+    with open(data_path, "r") as f:
+        data = json.load(f)
+    keys = sorted(data)
+
+    with _parsed_files_lock:
+        _parsed_files[data_path] = (stamp, keys, data)
+        _parsed_files.move_to_end(data_path)
+        while len(_parsed_files) > MAX_CACHED_FILES:
+            _parsed_files.popitem(last=False)
+    return keys, data
+
+
+def _months(start_date, end_date):
+    """YYYY-MM of every month overlapping start_date..end_date."""
+    year, month = int(start_date[:4]), int(start_date[5:7])
+    last = (int(end_date[:4]), int(end_date[5:7]))
+    months = []
+    while (year, month) <= last:
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _write_json(path, content):
+    with atomic_write(path) as f:
+        json.dump(content, f)
+
+
+def partition_file(data_path, partition_dir):
+    """
+    Split one formatted finnhub file into {YYYY-MM}.json files under partition_dir.
+    Skipped when the partitions were already written from the same source file.
+    Returns True if the file was (re)partitioned.
+    """
+    stamp = file_stamp(data_path)
+    source_path = os.path.join(partition_dir, "_source.json")
+    if os.path.exists(source_path):
+        with open(source_path, "r") as f:
+            if json.load(f)["stamp"] == stamp:
+                return False
+
+    with open(data_path, "r") as f:
+        data = json.load(f)
+
+    by_month = {}
+    for key, value in data.items():
+        by_month.setdefault(key[:7], {})[key] = value
+
+    os.makedirs(partition_dir, exist_ok=True)
+    # drop the source stamp first so readers fall back to the source file
+    if os.path.exists(source_path):
+        os.remove(source_path)
+    for name in os.listdir(partition_dir):
+        if name.endswith(".json"):
+            os.remove(os.path.join(partition_dir, name))
+    for month, month_data in by_month.items():
+        _write_json(os.path.join(partition_dir, f"{month}.json"), month_data)
+    # written last, so an interrupted run is redone next time
+    _write_json(source_path, {"source": data_path, "stamp": stamp})
+    return True
+
+
+def partition_finnhub_data(data_dir, data_types=None):
+    """
+    Repartition finnhub_data/<data_type>/{ticker}[_{period}]_data_formatted.json
+    into finnhub_data_partitioned/<data_type>/{ticker}[_{period}]/{YYYY-MM}.json,
+    so range reads only parse the months overlapping the window.
+    Args:
+        data_dir (str): Directory where the data is saved.
+        data_types (list): Data types to convert; all of them by default.
+    Returns:
+        dict: number of files (re)partitioned per data type.
+    """
+    suffix = "_data_formatted.json"
+    source_root = os.path.join(data_dir, "finnhub_data")
+    if data_types is None:
+        data_types = sorted(
+            name
+            for name in os.listdir(source_root)
+            if os.path.isdir(os.path.join(source_root, name))
+        )
+
+    converted = {}
+    for data_type in data_types:
+        converted[data_type] = 0
+        for file_name in sorted(os.listdir(os.path.join(source_root, data_type))):
+            if not file_name.endswith(suffix):
+                continue
+            partition_dir = os.path.join(
+                data_dir, PARTITIONED_DIR, data_type, file_name[: -len(suffix)]
+            )
+            if partition_file(
+                os.path.join(source_root, data_type, file_name), partition_dir
+            ):
+                converted[data_type] += 1
+    return converted
+
+
+def _partitions_current(data_path, partition_dir):
+    source_path = os.path.join(partition_dir, "_source.json")
+    if not os.path.exists(source_path):
+        return False
+    with open(source_path, "r") as f:
+        stamp = json.load(f)["stamp"]
+    # a partition without its source file is used as is
+    return not os.path.exists(data_path) or file_stamp(data_path) == stamp
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -13,24 +149,32 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
+    name = f"{ticker}_{period}" if period else ticker
+    data_path = os.path.join(
+        data_dir, "finnhub_data", data_type, f"{name}_data_formatted.json"
+    )
+    partition_dir = os.path.join(data_dir, PARTITIONED_DIR, data_type, name)
 
-    data = open(data_path, "r")
-    data = json.load(data)
+    # read only the monthly partitions overlapping the window when they are up
+    # to date with the source file; otherwise fall back to the full file
+    if _partitions_current(data_path, partition_dir):
+        paths = [
+            os.path.join(partition_dir, f"{month}.json")
+            for month in _months(start_date, end_date)
+        ]
+        paths = [path for path in paths if os.path.exists(path)]
+    else:
+        paths = [data_path]
 
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
     filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
+    for path in paths:
+        keys, data = _load_formatted(path)
+
+        # keys (date, str in format YYYY-MM-DD) are sorted, so the date range is
+        # a bisect on either end instead of a scan over every key
+        lo, hi = bisect_left(keys, start_date), bisect_right(keys, end_date)
+        for key in keys[lo:hi]:
+            value = data[key]
+            if len(value) > 0:
+                filtered_data[key] = value
     return filtered_data
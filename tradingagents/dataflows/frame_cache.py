@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .config import get_config
+
+# (symbol, source, adjustment), e.g. ("AAPL", "offline", "raw")
+FrameKey = Tuple[str, str, str]
+
+
+class FrameCache:
+    """
+    Process-wide LRU cache of loaded price frames.
+
+    Frames are keyed by ``(symbol, source, adjustment)`` and accounted by their
+    deep memory usage. When the total exceeds ``max_bytes`` the least recently
+    used frames are evicted. Cached frames are shared between callers and must
+    be treated as read-only; copy before mutating.
+    """
+
+    def __init__(self, max_bytes: Annotated[int, "memory budget in bytes"]):
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[FrameKey, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: FrameKey) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: FrameKey, frame: pd.DataFrame) -> None:
+        size = int(frame.memory_usage(deep=True).sum())
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                # never cache a frame that alone exceeds the budget
+                return
+            self._frames[key] = (frame, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._frames))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def get_or_load(
+        self, key: FrameKey, loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return the cached frame for key, calling loader on a miss."""
+        frame = self.get(key)
+        if frame is None:
+            frame = loader()
+            self.put(key, frame)
+        return frame
+
+    def invalidate(self, key: Optional[FrameKey] = None) -> None:
+        """Drop one frame, or every frame when key is None."""
+        with self._lock:
+            if key is None:
+                self._frames.clear()
+                self._bytes = 0
+            else:
+                self._discard(key)
+
+    def _discard(self, key: FrameKey) -> None:
+        entry = self._frames.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._frames),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_frame_cache: Optional[FrameCache] = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_frame_cache() -> FrameCache:
+    """Return the process-wide FrameCache, sized from ``frame_cache_max_mb``."""
+    global _frame_cache
+    max_bytes = int(get_config()["frame_cache_max_mb"] * 1024 * 1024)
+    with _frame_cache_lock:
+        if _frame_cache is None:
+            _frame_cache = FrameCache(max_bytes)
+        elif _frame_cache.max_bytes != max_bytes:
+            _frame_cache.max_bytes = max_bytes
+        return _frame_cache
@@ -0,0 +1,144 @@
+import os
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .utils import file_stamp
+
+# statement -> (sub-directory, file name) under the SimFin data directory
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "us-balance-{freq}.csv"),
+    "cashflow": ("cash_flow", "us-cashflow-{freq}.csv"),
+    "income_statements": ("income_statements", "us-income-{freq}.csv"),
+}
+
+
+class _StatementTable:
+    """One SimFin statement file, sorted by ticker then publish date."""
+
+    def __init__(self, data: pd.DataFrame, stamp: list):
+        # keep the original row labels; rows are addressed by position below
+        self.data = data.sort_values(["Ticker", "Publish Date"], kind="stable")
+        publish_dates = self.data["Publish Date"].dt.tz_localize(None)
+        self.publish_dates = publish_dates.to_numpy(dtype="datetime64[ns]")
+        self.stamp = stamp
+
+        # each ticker's rows are contiguous after the sort
+        tickers = self.data["Ticker"].to_numpy()
+        self.partitions: Dict[str, Tuple[int, int]] = {}
+        if len(tickers):
+            starts = np.flatnonzero(np.r_[True, tickers[1:] != tickers[:-1]])
+            stops = np.r_[starts[1:], len(tickers)]
+            for start, stop in zip(starts, stops):
+                self.partitions[tickers[start]] = (int(start), int(stop))
+
+
+class FundamentalsStore:
+    """
+    In-memory index over the US-wide SimFin statement files.
+
+    Each ``us-*-{freq}.csv`` is parsed once per process (and again only when the
+    file changes on disk) into a table partitioned by ticker and sorted by
+    publish date, so "latest statement published on or before a date" is a
+    dictionary lookup plus a binary search instead of a full CSV scan.
+    """
+
+    def __init__(
+        self,
+        simfin_dir: Annotated[str, "the simfin_data_all directory"],
+    ):
+        self.simfin_dir = simfin_dir
+        self._tables: Dict[Tuple[str, str], _StatementTable] = {}
+        self._lock = threading.Lock()
+
+    def statement_path(self, statement: str, freq: str) -> str:
+        sub_dir, file_name = SIMFIN_STATEMENTS[statement]
+        return os.path.join(
+            self.simfin_dir,
+            sub_dir,
+            "companies",
+            "us",
+            file_name.format(freq=freq),
+        )
+
+    def _table(self, statement: str, freq: str) -> _StatementTable:
+        path = self.statement_path(statement, freq)
+        stamp = file_stamp(path)
+        key = (statement, freq)
+
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None and table.stamp == stamp:
+                return table
+
+            data = pd.read_csv(path, sep=";")
+            # Convert date strings to datetime objects and remove any time components
+            data["Report Date"] = pd.to_datetime(
+                data["Report Date"], utc=True
+            ).dt.normalize()
+            data["Publish Date"] = pd.to_datetime(
+                data["Publish Date"], utc=True
+            ).dt.normalize()
+
+            table = _StatementTable(data, stamp)
+            self._tables[key] = table
+            return table
+
+    def latest_statement(
+        self,
+        statement: Annotated[
+            str, "one of 'balance_sheet', 'cashflow', 'income_statements'"
+        ],
+        freq: Annotated[str, "reporting frequency: annual / quarterly"],
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """
+        Return the ticker's most recent statement published on or before
+        curr_date, or None when there is none.
+        """
+        table = self._table(statement, freq)
+        partition = table.partitions.get(ticker)
+        if partition is None:
+            return None
+
+        start, stop = partition
+        publish_dates = table.publish_dates[start:stop]
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+        as_of = np.datetime64(curr_date_dt.tz_localize(None), "ns")
+
+        pos = int(np.searchsorted(publish_dates, as_of, side="right")) - 1
+        if pos < 0:
+            return None
+        # with several filings on the latest date, take the first one in the file
+        pos = int(np.searchsorted(publish_dates, publish_dates[pos], side="left"))
+        return table.data.iloc[start + pos]
+
+    def latest_statements(
+        self,
+        freq: Annotated[str, "reporting frequency: annual / quarterly"],
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Dict[str, Optional[pd.Series]]:
+        """Latest balance sheet, cash flow and income statement as of curr_date."""
+        return {
+            statement: self.latest_statement(statement, freq, ticker, curr_date)
+            for statement in SIMFIN_STATEMENTS
+        }
+
+
+_stores: Dict[str, FundamentalsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store(
+    simfin_dir: Annotated[str, "the simfin_data_all directory"],
+) -> FundamentalsStore:
+    """Return the process-wide FundamentalsStore for a SimFin directory."""
+    key = os.path.abspath(simfin_dir)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = FundamentalsStore(simfin_dir)
+        return _stores[key]
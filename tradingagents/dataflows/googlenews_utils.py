@@ -1,9 +1,13 @@
+import asyncio
+import contextvars
 import json
+import threading
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 import time
-import random
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -12,97 +16,302 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .utils import report_retry
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``rate`` requests per second on average, with
+    bursts of up to ``capacity``. Each caller reserves a token and then waits
+    out the returned delay, so sync and async callers share one budget.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_session = None
+_rate_limiter = None
+_executor = None
+_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide keep-alive requests.Session for Google News."""
+    global _session
+    with _lock:
+        if _session is None:
+            pool_size = get_config()["google_news_max_concurrency"]
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def get_rate_limiter():
+    """Return the token bucket shared by every Google News request in the process."""
+    global _rate_limiter
+    with _lock:
+        if _rate_limiter is None:
+            config = get_config()
+            _rate_limiter = TokenBucket(
+                config["google_news_requests_per_second"], config["google_news_burst"]
+            )
+        return _rate_limiter
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_config()["google_news_max_concurrency"],
+                thread_name_prefix="tradingagents-gnews",
+            )
+        return _executor
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
     return response.status_code == 429
 
 
+def _report_retry(retry_state):
+    report_retry("google_news")
+
+
 @retry(
     retry=(retry_if_result(is_rate_limited)),
     wait=wait_exponential(multiplier=1, min=4, max=60),
     stop=stop_after_attempt(5),
+    before_sleep=_report_retry,
 )
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    # Wait for the shared rate limit instead of a fixed random delay
+    get_rate_limiter().acquire()
+    response = get_session().get(url, headers=headers, timeout=30)
+    return response
+
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+    before_sleep=_report_retry,
+)
+async def amake_request(client, url, headers):
+    """Async make_request over a shared httpx.AsyncClient"""
+    await get_rate_limiter().aacquire()
+    response = await client.get(url, headers=headers)
     return response
 
 
+def _to_search_date(value):
+    """Google News date filters expect mm/dd/yyyy"""
+    if "-" in value:
+        value = datetime.strptime(value, "%Y-%m-%d").strftime("%m/%d/%Y")
+    return value
+
+
+def _search_url(query, start_date, end_date, page):
+    offset = page * 10
+    return (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+
+def _parse_results_page(content):
+    """
+    Parse one page of search results.
+    Returns the results on the page and whether there is a next page.
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    results_on_page = soup.select("div.SoaBEf")
+
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    has_next = bool(results_on_page) and soup.find("a", id="pnnext") is not None
+    return news_results, has_next
+
+
+def _fetch_page(query, start_date, end_date, page):
+    response = make_request(_search_url(query, start_date, end_date, page), HEADERS)
+    return _parse_results_page(response.content)
+
+
+def _collect_pages(pages, last_page):
+    """Results of pages 0..last_page in page order."""
+    news_results = []
+    for page in range(last_page + 1):
+        news_results.extend(pages[page])
+    return news_results
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+
+    Up to google_news_max_concurrency pages are fetched ahead at a time and
+    parsed as they arrive; once a page turns out to be the last one, pages
+    after it are dropped.
     """
-    if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        start_date = start_date.strftime("%m/%d/%Y")
-    if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        end_date = end_date.strftime("%m/%d/%Y")
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
+    start_date = _to_search_date(start_date)
+    end_date = _to_search_date(end_date)
+    max_concurrency = get_config()["google_news_max_concurrency"]
+    executor = _get_executor()
 
-    news_results = []
-    page = 0
+    pages = {}
+    in_flight = {}
+    next_page = 0
+    # index of the last page to keep, once known
+    last_page = None
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+        while len(in_flight) < max_concurrency and (
+            last_page is None or next_page <= last_page
+        ):
+            # run in this context so retries are reported to the calling run
+            future = executor.submit(
+                contextvars.copy_context().run,
+                _fetch_page,
+                query,
+                start_date,
+                end_date,
+                next_page,
+            )
+            in_flight[future] = next_page
+            next_page += 1
+        if not in_flight:
+            break
 
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
-
-            page += 1
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            page = in_flight.pop(future)
+            try:
+                pages[page], has_next = future.result()
+            except Exception as e:
+                print(f"Failed after multiple retries: {e}")
+                last_page = page - 1 if last_page is None else min(last_page, page - 1)
+                continue
+            if not has_next:
+                last_page = page if last_page is None else min(last_page, page)
 
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
+        if last_page is not None:
+            # pages past the last one are not needed
+            for future, page in list(in_flight.items()):
+                if page > last_page and future.cancel():
+                    del in_flight[future]
+
+    return _collect_pages(pages, last_page)
+
+
+async def agetNewsData(query, start_date, end_date, client):
+    """
+    Async getNewsData; pages are fetched over the given httpx.AsyncClient,
+    up to google_news_max_concurrency at a time.
+    """
+    start_date = _to_search_date(start_date)
+    end_date = _to_search_date(end_date)
+    max_concurrency = get_config()["google_news_max_concurrency"]
+
+    async def fetch_page(page):
+        url = _search_url(query, start_date, end_date, page)
+        response = await amake_request(client, url, HEADERS)
+        return _parse_results_page(response.content)
+
+    pages = {}
+    in_flight = {}
+    next_page = 0
+    last_page = None
+    while True:
+        while len(in_flight) < max_concurrency and (
+            last_page is None or next_page <= last_page
+        ):
+            in_flight[asyncio.ensure_future(fetch_page(next_page))] = next_page
+            next_page += 1
+        if not in_flight:
             break
 
-    return news_results
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            page = in_flight.pop(task)
+            try:
+                pages[page], has_next = task.result()
+            except Exception as e:
+                print(f"Failed after multiple retries: {e}")
+                last_page = page - 1 if last_page is None else min(last_page, page - 1)
+                continue
+            if not has_next:
+                last_page = page if last_page is None else min(last_page, page)
+
+        if last_page is not None:
+            for task, page in list(in_flight.items()):
+                if page > last_page:
+                    task.cancel()
+                    del in_flight[task]
+
+    return _collect_pages(pages, last_page)
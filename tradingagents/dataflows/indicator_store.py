@@ -0,0 +1,272 @@
+import json
+import os
+import shutil
+import threading
+from typing import Annotated, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+from .config import get_config
+from .frame_cache import get_frame_cache
+from .price_store import get_price_store
+from .stockstats_utils import BEST_IND_PARAMS
+from .utils import index_by_date, slice_date_range, temp_path
+from .yfin_cache import get_yfin_history_cache
+
+# Bars recomputed ahead of the first changed row. It covers the longest window
+# (close_200_sma) and lets the EMA/SMMA based indicators (macd, rsi, atr) decay
+# their seed to well below float precision, so an incremental update matches a
+# full recompute.
+WARMUP_BARS = 600
+
+# Price columns the indicators are computed from
+INPUT_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class IndicatorStore:
+    """
+    Materialized, per-symbol store of the supported stockstats indicators.
+
+    Every indicator in ``BEST_IND_PARAMS`` is computed over a symbol's full price
+    history and written to ``store_dir/<source>/<symbol>/`` as one ``.npy`` file
+    per column, alongside the ``Date`` and OHLCV columns it was computed from.
+    The store is brought up to date whenever the price file it was computed from
+    changes. When new bars are appended only the rows from the first changed bar
+    onwards are recomputed (with ``warmup_bars`` of history in front of them); a
+    change to any input column anywhere earlier, such as a split re-adjustment,
+    triggers a full recompute. Indicator reads are then plain lookups.
+    """
+
+    def __init__(
+        self,
+        store_dir: Annotated[str, "directory where the indicator columns are written"],
+        indicators: Annotated[
+            Sequence[str], "stockstats indicators to materialize"
+        ] = tuple(BEST_IND_PARAMS),
+        warmup_bars: Annotated[
+            int, "bars recomputed ahead of the first changed row"
+        ] = WARMUP_BARS,
+    ):
+        self.store_dir = store_dir
+        self.indicators = list(indicators)
+        self.warmup_bars = warmup_bars
+        self._columns: Dict[tuple, Dict[str, np.ndarray]] = {}
+        self._source_stamp: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _source(online: bool) -> str:
+        return "online" if online else "offline"
+
+    def _symbol_dir(self, symbol: str, online: bool) -> str:
+        return os.path.join(self.store_dir, self._source(online), symbol)
+
+    @staticmethod
+    def _prices(
+        symbol: str, data_dir: str, online: bool
+    ) -> Tuple[pd.DataFrame, list]:
+        """
+        The shared, read-only price history (not copied) and the stamp of the
+        file it was loaded from.
+        """
+        if not online:
+            store = get_price_store(data_dir)
+            try:
+                prices = store.get_frame(symbol)
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            return prices, store.source_stamp(symbol)
+
+        cache = get_yfin_history_cache()
+        prices = cache.get_history(symbol)
+        # nothing is written for a symbol yfinance returned no bars for
+        return prices, cache.history_stamp(symbol) or [0]
+
+    @staticmethod
+    def _read_meta(symbol_dir: str) -> Optional[dict]:
+        meta_path = os.path.join(symbol_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _load(symbol_dir: str, meta: dict) -> Dict[str, np.ndarray]:
+        return {
+            column["name"]: np.load(
+                os.path.join(symbol_dir, column["file"]), mmap_mode="r"
+            )
+            for column in meta["columns"]
+        }
+
+    def _materialize(
+        self, symbol_dir: str, prices: pd.DataFrame, meta: Optional[dict], stamp: list
+    ) -> None:
+        dates = prices.index.to_numpy(dtype="datetime64[ns]")
+        inputs = {
+            name: prices[name].to_numpy(dtype=float)
+            for name in INPUT_COLUMNS
+            if name in prices
+        }
+
+        # keep the stored rows whose inputs are unchanged; the last stored bar
+        # is always recomputed since an intraday bar may since have been revised
+        first_changed = 0
+        stored = None
+        if meta is not None and meta["indicators"] == self.indicators:
+            stored = self._load(symbol_dir, meta)
+            keep = len(stored["Date"]) - 1
+            if (
+                0 < keep <= len(prices)
+                and np.array_equal(stored["Date"][:keep], dates[:keep])
+                and all(
+                    name in stored
+                    and np.array_equal(
+                        stored[name][:keep], values[:keep], equal_nan=True
+                    )
+                    for name, values in inputs.items()
+                )
+            ):
+                first_changed = keep
+
+        start = max(0, first_changed - self.warmup_bars)
+        df = wrap(prices.iloc[start:].copy())
+        for indicator in self.indicators:
+            df[indicator]  # trigger stockstats to calculate the indicator
+
+        columns = {"Date": dates, **inputs}
+        for indicator in self.indicators:
+            tail = df[indicator].to_numpy(dtype=float)[first_changed - start :]
+            if first_changed:
+                columns[indicator] = np.concatenate(
+                    [stored[indicator][:first_changed], tail]
+                )
+            else:
+                columns[indicator] = tail
+
+        tmp_dir = temp_path(symbol_dir)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        column_meta = []
+        for i, (name, array) in enumerate(columns.items()):
+            file_name = f"{i}.npy"
+            np.save(os.path.join(tmp_dir, file_name), array, allow_pickle=False)
+            column_meta.append({"name": name, "file": file_name})
+
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump(
+                {
+                    "source_stamp": stamp,
+                    "indicators": self.indicators,
+                    "recomputed_from": first_changed,
+                    "columns": column_meta,
+                },
+                f,
+            )
+
+        # release any maps of the old files before swapping the directory in
+        del stored
+        shutil.rmtree(symbol_dir, ignore_errors=True)
+        os.replace(tmp_dir, symbol_dir)
+
+    def materialize(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_dir: Annotated[str, "directory where the offline stock data is stored"],
+        online: Annotated[bool, "whether to use the online price history"] = False,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Bring the stored indicators up to date with the price history and return
+        the memory-mapped columns.
+        """
+        prices, stamp = self._prices(symbol, data_dir, online)
+        key = (self._source(online), symbol)
+
+        with self._lock:
+            if self._source_stamp.get(key) == stamp:
+                return self._columns[key]
+
+        symbol_dir = self._symbol_dir(symbol, online)
+        meta = self._read_meta(symbol_dir)
+        if (
+            meta is None
+            or meta["source_stamp"] != stamp
+            or meta["indicators"] != self.indicators
+        ):
+            with self._lock:
+                self._columns.pop(key, None)
+                self._source_stamp.pop(key, None)
+            self._materialize(symbol_dir, prices, meta, stamp)
+            meta = self._read_meta(symbol_dir)
+
+        mapped = self._load(symbol_dir, meta)
+        with self._lock:
+            self._columns[key] = mapped
+            self._source_stamp[key] = stamp
+        return mapped
+
+    def get_frame(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_dir: Annotated[str, "directory where the offline stock data is stored"],
+        online: Annotated[bool, "whether to use the online price history"] = False,
+    ) -> pd.DataFrame:
+        """
+        Return every stored indicator as a shared, read-only frame indexed by
+        date, with the Date column as YYYY-mm-dd strings.
+        """
+        columns = self.materialize(symbol, data_dir, online)
+        stamp = self._source_stamp.get((self._source(online), symbol))
+        source = f"indicators:{self._source(online)}:{data_dir}"
+        key = (symbol, source, "materialized")
+        frame_cache = get_frame_cache()
+
+        frame = frame_cache.get(key)
+        if frame is None or frame.attrs.get("source_stamp") != stamp:
+            names = ["Date"] + self.indicators
+            frame = pd.DataFrame({name: np.asarray(columns[name]) for name in names})
+            frame["Date"] = frame["Date"].dt.strftime("%Y-%m-%d")
+            index_by_date(frame, columns["Date"])
+            frame.attrs["source_stamp"] = stamp
+            frame_cache.put(key, frame)
+        return frame
+
+    def get_table(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[List[str], "stored indicators to look up"],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[str, "directory where the offline stock data is stored"],
+        online: Annotated[bool, "whether to use the online price history"] = False,
+    ) -> pd.DataFrame:
+        """
+        Look up a date x indicator table for the trading days between start_date
+        and end_date (inclusive), indexed by YYYY-mm-dd date.
+        """
+        missing = [ind for ind in indicators if ind not in self.indicators]
+        if missing:
+            raise ValueError(f"Indicators {missing} are not materialized")
+
+        frame = self.get_frame(symbol, data_dir, online)
+        window = slice_date_range(frame, start_date, end_date)
+        table = pd.DataFrame(window[list(indicators)])
+        table.index = window["Date"].values
+        table.index.name = "Date"
+        return table
+
+
+_stores: Dict[str, IndicatorStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_indicator_store() -> IndicatorStore:
+    """Return the process-wide IndicatorStore for the configured store dir."""
+    store_dir = get_config()["indicator_store_dir"]
+    with _stores_lock:
+        if store_dir not in _stores:
+            _stores[store_dir] = IndicatorStore(store_dir)
+        return _stores[store_dir]
@@ -1,18 +1,26 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List
+from .reddit_utils import fetch_top_from_category_range
 from .yfin_utils import *
 from .stockstats_utils import *
+from .stockstats_utils import BEST_IND_PARAMS
 from .googlenews_utils import *
 from .finnhub_utils import get_data_in_range
+from .price_store import get_price_store
+from .yfin_cache import get_yfin_history_cache
+from .indicator_store import get_indicator_store
+from .fundamentals_store import get_fundamentals_store
+from .utils import file_stamp, slice_date_range
+from .trading_calendar import get_trading_calendar
+from .news_cache import get_news_cache, news_key
+from .openai_clients import get_openai_client
+from .async_utils import get_async_openai_client, get_http_client, run_blocking
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
 import pandas as pd
-from tqdm import tqdm
 import yfinance as yf
-from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
 
 
@@ -141,51 +149,62 @@ def get_finnhub_company_insider_transactions(
     )
 
 
-def get_simfin_balance_sheet(
-    ticker: Annotated[str, "ticker symbol"],
-    freq: Annotated[
-        str,
-        "reporting frequency of the company's financial history: annual / quarterly",
-    ],
-    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
+# SimFin statement -> (name used in reports, note appended to the report)
+SIMFIN_STATEMENT_NOTES = {
+    "balance_sheet": (
+        "balance sheet",
+        "This includes metadata like reporting dates and currency, share details, and a breakdown of assets, liabilities, and equity. Assets are grouped as current (liquid items like cash and receivables) and noncurrent (long-term investments and property). Liabilities are split between short-term obligations and long-term debts, while equity reflects shareholder funds such as paid-in capital and retained earnings. Together, these components ensure that total assets equal the sum of liabilities and equity.",
+    ),
+    "cashflow": (
+        "cash flow statement",
+        "This includes metadata like reporting dates and currency, share details, and a breakdown of cash movements. Operating activities show cash generated from core business operations, including net income adjustments for non-cash items and working capital changes. Investing activities cover asset acquisitions/disposals and investments. Financing activities include debt transactions, equity issuances/repurchases, and dividend payments. The net change in cash represents the overall increase or decrease in the company's cash position during the reporting period.",
+    ),
+    "income_statements": (
+        "income statement",
+        "This includes metadata like reporting dates and currency, share details, and a comprehensive breakdown of the company's financial performance. Starting with Revenue, it shows Cost of Revenue and resulting Gross Profit. Operating Expenses are detailed, including SG&A, R&D, and Depreciation. The statement then shows Operating Income, followed by non-operating items and Interest Expense, leading to Pretax Income. After accounting for Income Tax and any Extraordinary items, it concludes with Net Income, representing the company's bottom-line profit or loss for the period.",
+    ),
+}
 
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+def _format_simfin_statement(statement, ticker, freq, latest_statement):
+    title, note = SIMFIN_STATEMENT_NOTES[statement]
+
+    # drop the SimFinID column
+    latest_statement = latest_statement.drop("SimFinId")
+
+    return (
+        f"## {freq} {title} for {ticker} released on {str(latest_statement['Publish Date'])[0:10]}: \n"
+        + str(latest_statement)
+        + "\n\n"
+        + note
+    )
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+
+def _get_simfin_statement(statement, ticker, freq, curr_date):
+    # Most recent statement published on or before the current date, looked up
+    # in the ticker-partitioned, publish-date sorted store
+    latest_statement = get_fundamentals_store(
+        os.path.join(DATA_DIR, "fundamental_data", "simfin_data_all")
+    ).latest_statement(statement, freq, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No balance sheet available before the given current date.")
+    if latest_statement is None:
+        title = SIMFIN_STATEMENT_NOTES[statement][0]
+        print(f"No {title} available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+    return _format_simfin_statement(statement, ticker, freq, latest_statement)
 
-    # drop the SimFinID column
-    latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
-    return (
-        f"## {freq} balance sheet for {ticker} released on {str(latest_balance_sheet['Publish Date'])[0:10]}: \n"
-        + str(latest_balance_sheet)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a breakdown of assets, liabilities, and equity. Assets are grouped as current (liquid items like cash and receivables) and noncurrent (long-term investments and property). Liabilities are split between short-term obligations and long-term debts, while equity reflects shareholder funds such as paid-in capital and retained earnings. Together, these components ensure that total assets equal the sum of liabilities and equity."
-    )
+def get_simfin_balance_sheet(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    return _get_simfin_statement("balance_sheet", ticker, freq, curr_date)
 
 
 def get_simfin_cashflow(
@@ -196,105 +215,112 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    return _get_simfin_statement("cashflow", ticker, freq, curr_date)
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
-
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No cash flow statement available before the given current date.")
-        return ""
+def get_simfin_income_statements(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    return _get_simfin_statement("income_statements", ticker, freq, curr_date)
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
 
-    # drop the SimFinID column
-    latest_cash_flow = latest_cash_flow.drop("SimFinId")
+def get_simfin_fundamentals_snapshot(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> str:
+    """
+    Report the latest balance sheet, cash flow statement and income statement
+    published on or before curr_date, looked up together in the indexed store.
+    """
+    statements = get_fundamentals_store(
+        os.path.join(DATA_DIR, "fundamental_data", "simfin_data_all")
+    ).latest_statements(freq, ticker, curr_date)
+
+    sections = []
+    for statement, latest_statement in statements.items():
+        if latest_statement is None:
+            title = SIMFIN_STATEMENT_NOTES[statement][0]
+            sections.append(
+                f"## {freq} {title} for {ticker}: none published on or before {curr_date}"
+            )
+        else:
+            sections.append(
+                _format_simfin_statement(statement, ticker, freq, latest_statement)
+            )
 
-    return (
-        f"## {freq} cash flow statement for {ticker} released on {str(latest_cash_flow['Publish Date'])[0:10]}: \n"
-        + str(latest_cash_flow)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a breakdown of cash movements. Operating activities show cash generated from core business operations, including net income adjustments for non-cash items and working capital changes. Investing activities cover asset acquisitions/disposals and investments. Financing activities include debt transactions, equity issuances/repurchases, and dividend payments. The net change in cash represents the overall increase or decrease in the company's cash position during the reporting period."
-    )
+    return "\n\n".join(sections)
 
 
-def get_simfin_income_statements(
-    ticker: Annotated[str, "ticker symbol"],
+def get_simfin_fundamentals_screen(
+    tickers: Annotated[List[str], "ticker symbols to screen"],
     freq: Annotated[
         str,
         "reporting frequency of the company's financial history: annual / quarterly",
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
+) -> str:
+    """Point-in-time fundamentals snapshots for several tickers in one report."""
+    # de-duplicate while keeping the requested order
+    tickers = list(dict.fromkeys(tickers))
+
+    return "\n\n".join(
+        f"# {ticker} fundamentals as of {curr_date}\n\n"
+        + get_simfin_fundamentals_snapshot(ticker, freq, curr_date)
+        for ticker in tickers
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No income statement available before the given current date.")
-        return ""
+def get_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    query = query.replace(" ", "+")
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+    start_date = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = start_date - relativedelta(days=look_back_days)
+    before = before.strftime("%Y-%m-%d")
 
-    # drop the SimFinID column
-    latest_income = latest_income.drop("SimFinId")
+    def fetch():
+        news_results = getNewsData(query, before, curr_date)
+        return _format_google_news(query, before, curr_date, news_results)
 
-    return (
-        f"## {freq} income statement for {ticker} released on {str(latest_income['Publish Date'])[0:10]}: \n"
-        + str(latest_income)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a comprehensive breakdown of the company's financial performance. Starting with Revenue, it shows Cost of Revenue and resulting Gross Profit. Operating Expenses are detailed, including SG&A, R&D, and Depreciation. The statement then shows Operating Income, followed by non-operating items and Interest Expense, leading to Pretax Income. After accounting for Income Tax and any Extraordinary items, it concludes with Net Income, representing the company's bottom-line profit or loss for the period."
+    return get_news_cache().get_or_fetch(
+        "google_news", news_key(query, before, curr_date), curr_date, fetch
     )
 
 
-def get_google_news(
+async def aget_google_news(
     query: Annotated[str, "Query to search with"],
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
+    """Async get_google_news over the shared httpx connection pool."""
     query = query.replace(" ", "+")
 
     start_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    news_results = getNewsData(query, before, curr_date)
+    async def fetch():
+        news_results = await agetNewsData(query, before, curr_date, get_http_client())
+        return _format_google_news(query, before, curr_date, news_results)
+
+    return await get_news_cache().aget_or_fetch(
+        "google_news", news_key(query, before, curr_date), curr_date, fetch
+    )
+
 
+def _format_google_news(query, before, curr_date, news_results) -> str:
     news_str = ""
 
     for news in news_results:
@@ -326,38 +352,56 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    curr_date = start_date.strftime("%Y-%m-%d")
 
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
+    data_path = os.path.join(DATA_DIR, "reddit_data")
 
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
+    def fetch():
+        # one pass over each subreddit file for the whole lookback window
+        posts = fetch_top_from_category_range(
             "global_news",
-            curr_date_str,
+            before,
+            curr_date,
             max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
+            data_path=data_path,
         )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
 
-    pbar.close()
-
-    if len(posts) == 0:
-        return ""
+        if len(posts) == 0:
+            return ""
+
+        news_str = ""
+        for post in posts:
+            if post["content"] == "":
+                news_str += f"### {post['title']}\n\n"
+            else:
+                news_str += f"### {post['title']}\n\n{post['content']}\n\n"
+
+        return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
+
+    # the same for every ticker, so shared across the run; the key includes the
+    # subreddit files' stamps so updated data is read again
+    key = news_key(
+        "global",
+        before,
+        curr_date,
+        max_limit_per_day=max_limit_per_day,
+        data=_reddit_data_stamp(data_path, "global_news"),
+    )
+    return get_news_cache().get_or_fetch_shared(
+        "reddit_global_news", key, curr_date, fetch
+    )
 
-    news_str = ""
-    for post in posts:
-        if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
-        else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
 
-    return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
+def _reddit_data_stamp(data_path, category):
+    """(file name, mtime_ns, size) of each subreddit file of a category."""
+    category_path = os.path.join(data_path, category)
+    stamp = []
+    for data_file in sorted(os.listdir(category_path)):
+        if data_file.endswith(".jsonl"):
+            stamp.append(
+                [data_file, *file_stamp(os.path.join(category_path, data_file))]
+            )
+    return stamp
 
 
 def get_reddit_company_news(
@@ -380,32 +424,18 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    curr_date = start_date.strftime("%Y-%m-%d")
 
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # one pass over each subreddit file for the whole lookback window
+    posts = fetch_top_from_category_range(
+        "company_news",
+        before,
+        curr_date,
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
 
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
-
     if len(posts) == 0:
         return ""
 
@@ -429,152 +459,148 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
+    # look the lookback window up in the materialized indicator store
+    try:
+        table = get_indicator_store().get_table(
+            symbol,
+            [indicator],
+            before.strftime("%Y-%m-%d"),
+            end_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
         )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
-
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
+        indicator_values = dict(zip(table.index, table[indicator].values))
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicator {indicator} from {before.strftime('%Y-%m-%d')} to {end_date}: {e}"
+        )
+        indicator_values = {}
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+    # step through exchange sessions only; the dates present in the data take
+    # precedence over the holiday rules inside the range they cover
+    calendar = get_trading_calendar(pd.DatetimeIndex(list(indicator_values)))
 
-            curr_date = curr_date - relativedelta(days=1)
+    ind_string = ""
+    for session in calendar.lookback_sessions(end_date, look_back_days):
+        if session in indicator_values:
+            ind_string += f"{session}: {indicator_values[session]}\n"
+        elif online:
+            # offline mode only reports the dates present in the data
+            ind_string += f"{session}: N/A: No data available for this session yet\n"
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
     )
 
     return result_str
 
 
-def get_stockstats_indicator(
+def get_stock_stats_indicators_table(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
     curr_date: Annotated[
         str, "The current trading date you are trading on, YYYY-mm-dd"
     ],
+    look_back_days: Annotated[int, "how many days to look back"],
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
+    """
+    Look several indicators up in the materialized indicator store and report
+    them as one date x indicator table, most recent trading day first.
+    """
 
-    curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
-    curr_date = curr_date.strftime("%Y-%m-%d")
+    unsupported = [ind for ind in indicators if ind not in BEST_IND_PARAMS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+
+    # de-duplicate while keeping the requested order
+    indicators = list(dict.fromkeys(indicators))
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = (curr_date_dt - relativedelta(days=look_back_days)).strftime("%Y-%m-%d")
 
     try:
-        indicator_value = StockstatsUtils.get_stock_stats(
+        table = get_indicator_store().get_table(
             symbol,
-            indicator,
+            indicators,
+            before,
             curr_date,
             os.path.join(DATA_DIR, "market_data", "price_data"),
             online=online,
         )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicators {indicators} from {before} to {curr_date}: {e}"
+        )
+        return ""
+
+    with pd.option_context(
+        "display.max_rows", None, "display.max_columns", None, "display.width", None
+    ):
+        table_string = table.iloc[::-1].to_string(float_format="{:.4f}".format)
+
+    descriptions = "\n".join(
+        f"- {indicator}: {BEST_IND_PARAMS[indicator]}" for indicator in indicators
+    )
+
+    return (
+        f"## {', '.join(indicators)} values for {symbol} from {before} to {curr_date}:\n\n"
+        + table_string
+        + "\n\n"
+        + descriptions
+    )
+
+
+def get_stockstats_indicator(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> str:
+
+    curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
+    curr_date = curr_date.strftime("%Y-%m-%d")
+
+    try:
+        if indicator in BEST_IND_PARAMS:
+            table = get_indicator_store().get_table(
+                symbol,
+                [indicator],
+                curr_date,
+                curr_date,
+                os.path.join(DATA_DIR, "market_data", "price_data"),
+                online=online,
+            )
+            if len(table) > 0:
+                indicator_value = table[indicator].iloc[0]
+            else:
+                indicator_value = "N/A: Not a trading day (weekend or holiday)"
+        else:
+            indicator_value = StockstatsUtils.get_stock_stats(
+                symbol,
+                indicator,
+                curr_date,
+                os.path.join(DATA_DIR, "market_data", "price_data"),
+                online=online,
+            )
     except Exception as e:
         print(
             f"Error getting stockstats indicator data for indicator {indicator} on {curr_date}: {e}"
@@ -594,24 +620,10 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # read in data between the start and end dates (inclusive)
+    filtered_data = get_price_store(
+        os.path.join(DATA_DIR, "market_data", "price_data")
+    ).get_range(symbol, start_date, curr_date)
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -625,6 +637,18 @@ def get_YFin_data_window(
     )
 
 
+# Columns of get_YFin_data_online's output
+YFIN_ONLINE_COLUMNS = [
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Volume",
+    "Dividends",
+    "Stock Splits",
+]
+
+
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -634,11 +658,30 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
+    # Serve the range from the shared, incrementally refreshed history when it
+    # covers it; the cached history runs up to (but excluding) today. A cold
+    # cache is not filled here, so a short window costs only its own request.
+    history = get_yfin_history_cache().get_history(
+        symbol.upper(), download_if_missing=False
+    )
+    if (
+        history is not None
+        and not history.empty
+        and start_date >= history["Date"].iloc[0].strftime("%Y-%m-%d")
+        and end_date <= datetime.now().strftime("%Y-%m-%d")
+    ):
+        data = slice_date_range(
+            history, start_date, end_date, inclusive_end=False
+        ).set_index("Date")
+    else:
+        # Create ticker object
+        ticker = yf.Ticker(symbol.upper())
+
+        # Fetch historical data for the specified date range
+        data = ticker.history(start=start_date, end=end_date)
 
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    # Same columns whichever path served the range
+    data = data[[col for col in YFIN_ONLINE_COLUMNS if col in data]].copy()
 
     # Check if data is empty
     if data.empty:
@@ -667,54 +710,44 @@ def get_YFin_data_online(
     return header + csv_string
 
 
+async def aget_YFin_data_online(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+):
+    """Async get_YFin_data_online; yfinance has no async API, so it runs on the shared I/O pool."""
+    return await run_blocking(get_YFin_data_online, symbol, start_date, end_date)
+
+
 def get_YFin_data(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-
-    # remove the index from the dataframe
-    filtered_data = filtered_data.reset_index(drop=True)
+    # read in data between the start and end dates (inclusive)
+    filtered_data = get_price_store(
+        os.path.join(DATA_DIR, "market_data", "price_data")
+    ).get_range(symbol, start_date, end_date)
 
     return filtered_data
 
 
-def get_stock_news_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
-        model=config["quick_think_llm"],
+def _web_search_request(prompt):
+    """Request arguments for a web-search backed Responses API call."""
+    return dict(
+        model=get_config()["quick_think_llm"],
         input=[
             {
                 "role": "system",
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -734,74 +767,108 @@ def get_stock_news_openai(ticker, curr_date):
         store=True,
     )
 
-    return response.output[1].content[0].text
+
+def _stock_news_prompt(ticker, curr_date):
+    return f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period."
+
+
+def _global_news_prompt(curr_date):
+    return f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period."
+
+
+def _fundamentals_prompt(ticker, curr_date):
+    return f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc"
+
+
+def _web_search_key(query, curr_date, days_back):
+    """Cache key of a web search over the days_back days up to curr_date."""
+    start_date = datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(
+        days=days_back
+    )
+    return news_key(
+        query,
+        start_date.strftime("%Y-%m-%d"),
+        curr_date,
+        model=get_config()["quick_think_llm"],
+    )
+
+
+def _web_search(namespace, key, curr_date, prompt):
+    def fetch():
+        client = get_openai_client()
+
+        response = client.responses.create(**_web_search_request(prompt))
+
+        return response.output[1].content[0].text
+
+    return get_news_cache().get_or_fetch(namespace, key, curr_date, fetch)
+
+
+async def _aweb_search(namespace, key, curr_date, prompt):
+    async def fetch():
+        client = get_async_openai_client()
+
+        response = await client.responses.create(**_web_search_request(prompt))
+
+        return response.output[1].content[0].text
+
+    return await get_news_cache().aget_or_fetch(namespace, key, curr_date, fetch)
+
+
+def get_stock_news_openai(ticker, curr_date):
+    return _web_search(
+        "openai_stock_news",
+        _web_search_key(ticker, curr_date, 7),
+        curr_date,
+        _stock_news_prompt(ticker, curr_date),
+    )
+
+
+async def aget_stock_news_openai(ticker, curr_date):
+    return await _aweb_search(
+        "openai_stock_news",
+        _web_search_key(ticker, curr_date, 7),
+        curr_date,
+        _stock_news_prompt(ticker, curr_date),
+    )
 
 
 def get_global_news_openai(curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    # the same for every ticker: one web search per date across threads,
+    # processes and runs
+    def fetch():
+        client = get_openai_client()
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+        response = client.responses.create(
+            **_web_search_request(_global_news_prompt(curr_date))
+        )
+
+        return response.output[1].content[0].text
+
+    return get_news_cache().get_or_fetch_shared(
+        "openai_global_news", _web_search_key("global", curr_date, 7), curr_date, fetch
     )
 
-    return response.output[1].content[0].text
 
+async def aget_global_news_openai(curr_date):
+    # waiting on the shared entry's lock blocks, so it is done off the loop
+    return await run_blocking(get_global_news_openai, curr_date)
 
-def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+def get_fundamentals_openai(ticker, curr_date):
+    # the prompt covers the month before curr_date through curr_date
+    return _web_search(
+        "openai_fundamentals",
+        _web_search_key(ticker, curr_date, 31),
+        curr_date,
+        _fundamentals_prompt(ticker, curr_date),
     )
 
-    return response.output[1].content[0].text
+
+async def aget_fundamentals_openai(ticker, curr_date):
+    return await _aweb_search(
+        "openai_fundamentals",
+        _web_search_key(ticker, curr_date, 31),
+        curr_date,
+        _fundamentals_prompt(ticker, curr_date),
+    )
@@ -0,0 +1,174 @@
+import json
+import re
+import threading
+import time
+from typing import Annotated, Any, Dict, Iterable, List, Optional
+
+from .config import get_config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Preferred order when the backend is "auto"
+DECODER_BACKENDS = ("orjson", "msgspec", "json")
+
+
+def available_backends() -> List[str]:
+    """Installed JSON backends, fastest first."""
+    installed = {"orjson": orjson, "msgspec": msgspec, "json": json}
+    return [name for name in DECODER_BACKENDS if installed[name] is not None]
+
+
+class JsonlDecoder:
+    """
+    Line-delimited JSON decoder with a pluggable backend.
+
+    Uses orjson or msgspec when installed (falling back to the stdlib for lines
+    they reject, e.g. NaN literals). With the stdlib backend, whose full decode
+    is slow, it can also pull a single top-level number such as
+    ``created_utc`` out of the raw bytes so most lines can be rejected before
+    a full decode; orjson and msgspec decode a line faster than it can be
+    scanned, so they skip that. Counts lines and decode time so backends can
+    be compared on a corpus via ``stats()``.
+    """
+
+    def __init__(
+        self,
+        backend: Annotated[str, "'auto', 'orjson', 'msgspec' or 'json'"] = "auto",
+    ):
+        if backend == "auto":
+            backend = available_backends()[0]
+        if backend not in available_backends():
+            raise ValueError(
+                f"JSON backend {backend} is not available. Please choose from: {available_backends()}"
+            )
+        self.backend = backend
+        if backend == "orjson":
+            self._loads = orjson.loads
+            self._errors = (orjson.JSONDecodeError,)
+        elif backend == "msgspec":
+            self._loads = msgspec.json.Decoder().decode
+            self._errors = (msgspec.DecodeError,)
+        else:
+            self._loads = json.loads
+            self._errors = ()
+        # peeking only pays off when a full decode is slower than a regex scan
+        self.peeks_numbers = backend == "json"
+        self._number_patterns: Dict[str, "re.Pattern"] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.decoded = 0
+            self.prefiltered = 0
+            self.decode_seconds = 0.0
+
+    def decode(self, line: bytes) -> Any:
+        """Fully decode one line."""
+        start = time.perf_counter()
+        try:
+            value = self._loads(line)
+        except self._errors:
+            value = json.loads(line)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.decoded += 1
+            self.decode_seconds += elapsed
+        return value
+
+    def peek_number(self, line: bytes, field: str) -> Optional[float]:
+        """
+        The value of a numeric field read straight from the raw line, or None if
+        it cannot be told that way, in which case the line must be decoded.
+        Always None unless ``peeks_numbers``. Escaped quotes inside strings
+        never match; if the field also occurs in a nested object with a
+        different value (e.g. a crosspost), None is returned.
+        """
+        if not self.peeks_numbers:
+            return None
+        pattern = self._number_patterns.get(field)
+        if pattern is None:
+            pattern = re.compile(
+                rb'"'
+                + re.escape(field.encode())
+                + rb'"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)'
+            )
+            self._number_patterns[field] = pattern
+        values = set(pattern.findall(line))
+        return float(values.pop()) if len(values) == 1 else None
+
+    def count_prefiltered(self) -> None:
+        """Record a line rejected from a peeked field without a full decode."""
+        with self._lock:
+            self.prefiltered += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "decoded": self.decoded,
+                "prefiltered": self.prefiltered,
+                "decode_seconds": self.decode_seconds,
+                "lines_per_second": (
+                    self.decoded / self.decode_seconds if self.decode_seconds else 0.0
+                ),
+            }
+
+
+_decoders: Dict[str, JsonlDecoder] = {}
+_decoders_lock = threading.Lock()
+
+
+def get_jsonl_decoder() -> JsonlDecoder:
+    """Return the process-wide decoder for the configured ``jsonl_decoder``."""
+    backend = get_config()["jsonl_decoder"]
+    with _decoders_lock:
+        if backend not in _decoders:
+            _decoders[backend] = JsonlDecoder(backend)
+        return _decoders[backend]
+
+
+def benchmark_jsonl_decoders(
+    paths: Annotated[Iterable[str], "JSONL files to decode"],
+    backends: Annotated[
+        Optional[List[str]], "backends to compare; all installed by default"
+    ] = None,
+    prefilter_field: Annotated[
+        Optional[str], "numeric field to peek at, e.g. created_utc"
+    ] = "created_utc",
+) -> List[Dict[str, Any]]:
+    """
+    Decode every line of the given files with each backend and report lines per
+    second, for a full decode and (with prefilter_field, for the backends that
+    peek) for peeking that field.
+    """
+    paths = list(paths)
+    lines = []
+    for path in paths:
+        with open(path, "rb") as f:
+            lines.extend(line for line in f if line.strip())
+
+    results = []
+    for backend in backends or available_backends():
+        decoder = JsonlDecoder(backend)
+        for line in lines:
+            decoder.decode(line)
+        result = decoder.stats()
+        result["lines"] = len(lines)
+
+        if prefilter_field and decoder.peeks_numbers:
+            start = time.perf_counter()
+            for line in lines:
+                decoder.peek_number(line, prefilter_field)
+            elapsed = time.perf_counter() - start
+            result["peek_lines_per_second"] = len(lines) / elapsed if elapsed else 0.0
+        results.append(result)
+    return results
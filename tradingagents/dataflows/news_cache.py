@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Annotated, Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import get_config
+from .utils import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# How many shared entries each NewsCache keeps in memory
+MAX_SHARED_ENTRIES = 256
+
+
+def _lock_file(lock_file) -> None:
+    """Block until this process holds the exclusive lock on an open file."""
+    if fcntl is not None:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return
+    # LK_LOCK gives up after about 10 seconds; a fetch can take longer
+    lock_file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(lock_file) -> None:
+    if fcntl is not None:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def normalize_query(query: str) -> str:
+    """Case- and spacing-insensitive form of a search query ('+' counts as a space)."""
+    return re.sub(r"\s+", " ", query.replace("+", " ")).strip().lower()
+
+
+def news_key(
+    query: Annotated[str, "search query, ticker or topic"],
+    start_date: Annotated[str, "start of the date window, yyyy-mm-dd"],
+    end_date: Annotated[str, "end of the date window, yyyy-mm-dd"],
+    **extra,
+) -> Dict[str, Any]:
+    """Cache key for a search over a date window."""
+    return dict(
+        query=normalize_query(query), start=start_date, end=end_date, **extra
+    )
+
+
+class NewsCache:
+    """
+    Disk-backed cache of news search results, one JSON file per entry under
+    ``{cache_dir}/{namespace}/``.
+
+    A window ending before today can no longer change, so its entry never
+    expires and backtests over past dates only search once. Windows that
+    reach today expire after ``ttl``. Empty results are not cached, since they
+    usually mean the search failed or was blocked.
+
+    Results that many callers share, such as macro news that depends only on
+    the date, go through ``get_or_fetch_shared``: they are also memoized in
+    memory (the ``MAX_SHARED_ENTRIES`` most recently used), and concurrent
+    callers in any thread or process wait for the one fetching instead of
+    fetching again.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Annotated[str, "directory where the entries are stored"],
+        ttl: Annotated[timedelta, "lifetime of entries whose window reaches today"],
+    ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        # path -> (expires, value) of the shared entries seen by this process
+        self._memory: Dict[str, Tuple[Optional[float], Any]] = OrderedDict()
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, namespace: str, key: Dict[str, Any]) -> str:
+        digest = hashlib.sha1(
+            json.dumps(key, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, namespace, f"{digest}.json")
+
+    def _read(self, path: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry["key"] != key or self._expired(entry["expires"]):
+            return None
+        return entry
+
+    @staticmethod
+    def _expired(expires: Optional[float]) -> bool:
+        return expires is not None and datetime.now().timestamp() >= expires
+
+    def get(self, namespace: str, key: Dict[str, Any]) -> Optional[Any]:
+        """The cached value, or None if there is none or it has expired."""
+        entry = self._read(self._path(namespace, key), key)
+        return None if entry is None else entry["value"]
+
+    def put(
+        self,
+        namespace: str,
+        key: Dict[str, Any],
+        value: Any,
+        end_date: Annotated[str, "end of the date window, yyyy-mm-dd"],
+    ) -> Optional[float]:
+        """Store a value; returns its expiry timestamp (None for never)."""
+        if not value:
+            return None
+        if end_date < date.today().strftime("%Y-%m-%d"):
+            expires = None
+        else:
+            expires = (datetime.now() + self.ttl).timestamp()
+
+        path = self._path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_write(path) as f:
+            json.dump({"key": key, "expires": expires, "value": value}, f)
+        return expires
+
+    def get_or_fetch(
+        self,
+        namespace: str,
+        key: Dict[str, Any],
+        end_date: str,
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """Return the cached value, or call fetch() and cache its result."""
+        value = self.get(namespace, key)
+        if value is None:
+            value = fetch()
+            self.put(namespace, key, value, end_date)
+        return value
+
+    async def aget_or_fetch(
+        self,
+        namespace: str,
+        key: Dict[str, Any],
+        end_date: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Async get_or_fetch for a coroutine function fetch."""
+        value = self.get(namespace, key)
+        if value is None:
+            value = await fetch()
+            self.put(namespace, key, value, end_date)
+        return value
+
+    @contextmanager
+    def _exclusive(self, path: str):
+        """Hold path's lock against other threads and processes."""
+        with self._lock:
+            thread_lock = self._path_locks.setdefault(path, threading.Lock())
+        with thread_lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.lock", "a") as lock_file:
+                _lock_file(lock_file)
+                try:
+                    yield
+                finally:
+                    _unlock_file(lock_file)
+
+    def _remember(self, path: str, expires: Optional[float], value: Any) -> None:
+        with self._lock:
+            self._memory[path] = (expires, value)
+            self._memory.move_to_end(path)
+            while len(self._memory) > MAX_SHARED_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _recall(self, path: str) -> Optional[Tuple[Optional[float], Any]]:
+        with self._lock:
+            memo = self._memory.get(path)
+            if memo is not None:
+                self._memory.move_to_end(path)
+        return memo
+
+    def get_or_fetch_shared(
+        self,
+        namespace: str,
+        key: Dict[str, Any],
+        end_date: str,
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """
+        get_or_fetch for a result shared by many callers: memoized in memory,
+        and fetched by one caller at a time across threads and processes.
+        """
+        path = self._path(namespace, key)
+        memo = self._recall(path)
+        if memo is not None and not self._expired(memo[0]):
+            return memo[1]
+
+        with self._exclusive(path):
+            # another thread or process may have fetched it while we waited
+            entry = self._read(path, key)
+            if entry is not None:
+                expires, value = entry["expires"], entry["value"]
+            else:
+                value = fetch()
+                expires = self.put(namespace, key, value, end_date)
+                if not value:
+                    return value
+        self._remember(path, expires, value)
+        return value
+
+
+_caches: Dict[str, NewsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_news_cache() -> NewsCache:
+    """Return the process-wide NewsCache for the configured ``news_cache_dir``."""
+    config = get_config()
+    cache_dir = config["news_cache_dir"]
+    ttl = timedelta(minutes=config["news_cache_ttl_minutes"])
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = _caches[cache_dir] = NewsCache(cache_dir, ttl)
+        cache.ttl = ttl
+        return cache
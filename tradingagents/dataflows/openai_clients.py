@@ -0,0 +1,95 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from .config import get_config
+from .utils import areport_retry, report_retry
+
+# (base_url, api_key) -> client
+_clients: Dict[Tuple[str, Optional[str]], OpenAI] = {}
+_lock = threading.Lock()
+
+
+def client_key(
+    base_url: Optional[str] = None, api_key: Optional[str] = None
+) -> Tuple[str, Optional[str]]:
+    """Registry key of a client: its backend URL and the API key it resolves to."""
+    return (
+        base_url or get_config()["backend_url"],
+        api_key or os.environ.get("OPENAI_API_KEY"),
+    )
+
+
+def pool_limits() -> httpx.Limits:
+    """Connection pool limits of the shared OpenAI clients."""
+    config = get_config()
+    return httpx.Limits(
+        max_connections=config["openai_max_connections"],
+        max_keepalive_connections=config["openai_max_keepalive_connections"],
+    )
+
+
+def _is_retry(request: httpx.Request) -> bool:
+    # the SDK numbers the attempts at one request in this header
+    return request.headers.get("x-stainless-retry-count", "0") != "0"
+
+
+def _report_retried_request(request: httpx.Request) -> None:
+    if _is_retry(request):
+        report_retry("openai")
+
+
+async def _areport_retried_request(request: httpx.Request) -> None:
+    if _is_retry(request):
+        await areport_retry("openai")
+
+
+def openai_http_client() -> httpx.Client:
+    """
+    httpx client for an OpenAI client: pooled with pool_limits(), and
+    reporting the SDK's retries to the graph run making the request.
+    """
+    return DefaultHttpxClient(
+        limits=pool_limits(), event_hooks={"request": [_report_retried_request]}
+    )
+
+
+def openai_async_http_client() -> httpx.AsyncClient:
+    """Async openai_http_client."""
+    return DefaultAsyncHttpxClient(
+        limits=pool_limits(), event_hooks={"request": [_areport_retried_request]}
+    )
+
+
+def get_openai_client(
+    base_url: Optional[str] = None, api_key: Optional[str] = None
+) -> OpenAI:
+    """
+    Return the process-wide OpenAI client for a backend URL and API key
+    (by default the configured backend_url and OPENAI_API_KEY). Clients keep
+    their connections alive, so repeated calls skip the connect and TLS
+    handshake.
+    """
+    key = client_key(base_url, api_key)
+    with _lock:
+        client = _clients.get(key)
+        if client is None or client.is_closed():
+            client = OpenAI(
+                base_url=key[0],
+                api_key=key[1],
+                http_client=openai_http_client(),
+            )
+            _clients[key] = client
+        return client
+
+
+def close_openai_clients() -> None:
+    """Close every shared client, e.g. before the process exits."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,50 @@
+import os
+from typing import Annotated, Dict, List
+
+from .config import get_config
+from .indicator_store import get_indicator_store
+from .yfin_cache import get_yfin_history_cache
+
+
+def load_watchlist(
+    path: Annotated[str, "text file with one ticker per line; '#' starts a comment"],
+) -> List[str]:
+    """Read a watchlist file into a list of ticker symbols."""
+    symbols = []
+    with open(path, "r") as f:
+        for line in f:
+            symbol = line.split("#", 1)[0].strip()
+            if symbol:
+                symbols.append(symbol)
+    return symbols
+
+
+def prefetch_universe(
+    symbols: Annotated[List[str], "ticker symbols of the trading universe"],
+    batch_size: Annotated[int, "symbols per multi-symbol YFinance request"] = 50,
+    materialize_indicators: Annotated[
+        bool, "also bring the stored technical indicators up to date"
+    ] = True,
+) -> Dict[str, int]:
+    """
+    Warm the online price cache for a whole universe ahead of a run.
+
+    Symbols are refreshed with batched multi-symbol downloads instead of one
+    request per ticker, so a later analysis of any of them is served from the
+    local cache. The materialized indicators are updated too, so indicator
+    tool calls become lookups. Returns the number of cached daily bars per symbol.
+    """
+    # de-duplicate while keeping the caller's order
+    universe = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols))
+    if not universe:
+        return {}
+    summary = get_yfin_history_cache().refresh_many(universe, batch_size=batch_size)
+
+    if materialize_indicators:
+        data_dir = os.path.join(get_config()["data_dir"], "market_data", "price_data")
+        store = get_indicator_store()
+        for symbol, rows in summary.items():
+            if rows:
+                store.materialize(symbol, data_dir, online=True)
+
+    return summary
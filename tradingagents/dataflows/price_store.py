@@ -0,0 +1,206 @@
+import json
+import os
+import shutil
+import threading
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .frame_cache import get_frame_cache
+from .utils import file_stamp, index_by_date, temp_path
+
+OFFLINE_PRICE_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+class PriceStore:
+    """
+    Columnar, memory-mapped store for the offline YFinance price CSVs.
+
+    Each ``{symbol}-YFin-data-2015-01-01-2025-03-25.csv`` is converted once into
+    one ``.npy`` file per column under ``store_dir/<symbol>/``. Later reads map
+    those files instead of re-parsing the CSV, and date ranges are located with a
+    binary search over the sorted ``Date`` column so only the requested rows are
+    materialized. A store is rebuilt automatically when its source CSV changes.
+    """
+
+    def __init__(
+        self,
+        price_dir: Annotated[str, "directory holding the offline YFin CSV files"],
+        store_dir: Annotated[str, "directory where the columnar store is written"],
+    ):
+        self.price_dir = price_dir
+        self.store_dir = store_dir
+        self._columns: Dict[str, Dict[str, np.ndarray]] = {}
+        self._source_stamp: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def csv_path(self, symbol: str) -> str:
+        return os.path.join(self.price_dir, OFFLINE_PRICE_FILE.format(symbol=symbol))
+
+    def _symbol_dir(self, symbol: str) -> str:
+        return os.path.join(self.store_dir, symbol)
+
+    def _read_meta(self, symbol: str) -> Optional[dict]:
+        meta_path = os.path.join(self._symbol_dir(symbol), "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r") as f:
+            return json.load(f)
+
+    def convert(self, symbol: Annotated[str, "ticker symbol of the company"]) -> None:
+        """Parse the symbol's CSV once and write it out as one array per column."""
+        csv_path = self.csv_path(symbol)
+        stamp = file_stamp(csv_path)
+
+        data = pd.read_csv(csv_path)
+        # Keep only the calendar date; the CSV stores exchange-local timestamps
+        data["Date"] = pd.to_datetime(data["Date"].astype(str).str[:10])
+        data = data.sort_values("Date", kind="stable").reset_index(drop=True)
+
+        symbol_dir = self._symbol_dir(symbol)
+        tmp_dir = temp_path(symbol_dir)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        columns = []
+        for i, column in enumerate(data.columns):
+            values = data[column]
+            if column == "Date":
+                array = values.to_numpy(dtype="datetime64[ns]")
+            elif pd.api.types.is_numeric_dtype(values):
+                array = values.to_numpy()
+            else:
+                array = values.astype(str).to_numpy(dtype=str)
+            file_name = f"{i}.npy"
+            np.save(os.path.join(tmp_dir, file_name), array, allow_pickle=False)
+            columns.append({"name": column, "file": file_name})
+
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump(
+                {"source": csv_path, "source_stamp": stamp, "columns": columns}, f
+            )
+
+        with self._lock:
+            self._columns.pop(symbol, None)
+            self._source_stamp.pop(symbol, None)
+            shutil.rmtree(symbol_dir, ignore_errors=True)
+            os.replace(tmp_dir, symbol_dir)
+
+    def convert_all(self) -> list:
+        """Convert every offline price CSV found in ``price_dir``."""
+        suffix = OFFLINE_PRICE_FILE.format(symbol="")
+        converted = []
+        for file_name in sorted(os.listdir(self.price_dir)):
+            if file_name.endswith(suffix):
+                symbol = file_name[: -len(suffix)]
+                self.convert(symbol)
+                converted.append(symbol)
+        return converted
+
+    def source_stamp(
+        self, symbol: Annotated[str, "ticker symbol of the company"]
+    ) -> list:
+        """[mtime_ns, size] of the symbol's price CSV."""
+        return file_stamp(self.csv_path(symbol))
+
+    def columns(
+        self, symbol: Annotated[str, "ticker symbol of the company"]
+    ) -> Dict[str, np.ndarray]:
+        """Return the memory-mapped columns for a symbol, converting on first use."""
+        csv_path = self.csv_path(symbol)
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"No offline price data for {symbol}: {csv_path}")
+        stamp = file_stamp(csv_path)
+
+        with self._lock:
+            if self._source_stamp.get(symbol) == stamp:
+                return self._columns[symbol]
+
+        meta = self._read_meta(symbol)
+        if meta is None or meta["source_stamp"] != stamp:
+            self.convert(symbol)
+            meta = self._read_meta(symbol)
+
+        symbol_dir = self._symbol_dir(symbol)
+        mapped = {
+            column["name"]: np.load(
+                os.path.join(symbol_dir, column["file"]), mmap_mode="r"
+            )
+            for column in meta["columns"]
+        }
+
+        with self._lock:
+            self._columns[symbol] = mapped
+            self._source_stamp[symbol] = stamp
+        return mapped
+
+    @staticmethod
+    def _frame(columns: Dict[str, np.ndarray], lo: int, hi: int) -> pd.DataFrame:
+        """
+        Rows lo:hi as a frame whose price columns are views over the memory-mapped
+        arrays; only the Date column (as YYYY-mm-dd strings) is materialized.
+        """
+        frame = pd.DataFrame(
+            {name: np.asarray(array[lo:hi]) for name, array in columns.items()},
+            copy=False,
+        )
+        frame["Date"] = pd.DatetimeIndex(columns["Date"][lo:hi]).strftime("%Y-%m-%d")
+        return frame
+
+    def get_frame(
+        self, symbol: Annotated[str, "ticker symbol of the company"]
+    ) -> pd.DataFrame:
+        """
+        Return the full price history as a shared, read-only frame held in the
+        process-wide frame cache, indexed by a sorted datetime64 index.
+        """
+        columns = self.columns(symbol)
+        stamp = self._source_stamp.get(symbol)
+        key = (symbol, f"offline:{self.price_dir}", "raw")
+        frame_cache = get_frame_cache()
+
+        frame = frame_cache.get(key)
+        # rebuild if the source CSV changed since the frame was cached
+        if frame is None or frame.attrs.get("source_stamp") != stamp:
+            frame = self._frame(columns, 0, len(columns["Date"]))
+            index_by_date(frame, columns["Date"])
+            frame.attrs["source_stamp"] = stamp
+            frame_cache.put(key, frame)
+        return frame
+
+    def get_range(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format"] = None,
+        end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format"] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the rows between start_date and end_date (inclusive), found by
+        binary search on the mapped Date column. The price columns are read-only
+        views over the memory-mapped arrays, so only the range is paged in.
+        """
+        columns = self.columns(symbol)
+        dates = columns["Date"]
+        lo, hi = 0, len(dates)
+        if start_date is not None:
+            lo = int(np.searchsorted(dates, np.datetime64(start_date), side="left"))
+        if end_date is not None:
+            hi = int(np.searchsorted(dates, np.datetime64(end_date), side="right"))
+        return self._frame(columns, lo, max(lo, hi))
+
+_stores: Dict[tuple, PriceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(
+    price_dir: Annotated[str, "directory holding the offline YFin CSV files"],
+) -> PriceStore:
+    """Return the process-wide PriceStore for a price directory."""
+    store_dir = get_config()["price_store_dir"]
+    key = (os.path.abspath(price_dir), os.path.abspath(store_dir))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = PriceStore(price_dir, store_dir)
+        return _stores[key]
@@ -1,11 +1,17 @@
 import requests
 import time
+import heapq
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Annotated
 import os
 import re
+import threading
+
+from .jsonl_utils import get_jsonl_decoder
+from .utils import atomic_write, file_stamp
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,6 +55,240 @@ ticker_to_company = {
 }
 
 
+@lru_cache(maxsize=None)
+def company_matcher(query):
+    """
+    One compiled, case-insensitive alternation over the company's names in
+    ticker_to_company and the ticker itself. The names are regex patterns, as
+    they were when searched one by one.
+    """
+    if "OR" in ticker_to_company[query]:
+        search_terms = ticker_to_company[query].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[query]]
+
+    search_terms.append(query)
+
+    return re.compile("|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE)
+
+
+def _mentions_company(parsed_line, query):
+    matcher = company_matcher(query)
+    return bool(
+        matcher.search(parsed_line["title"]) or matcher.search(parsed_line["selftext"])
+    )
+
+
+def _utc_date(created_utc):
+    return datetime.utcfromtimestamp(created_utc).strftime("%Y-%m-%d")
+
+
+# Day indexes of the subreddit JSONL files live under <data_path>/_index/<category>/
+INDEX_DIR = "_index"
+
+# index path -> (source stamp, index)
+_loaded_indexes = {}
+_loaded_indexes_lock = threading.Lock()
+
+
+def _index_path(data_path, category, data_file):
+    return os.path.join(
+        data_path, INDEX_DIR, category, data_file[: -len(".jsonl")] + ".json"
+    )
+
+
+def _add_range(ranges, offset, length, adjacent_only=False):
+    """Append a byte range, merging it into the last one when they touch."""
+    if ranges and ranges[-1][0] + ranges[-1][1] == offset:
+        ranges[-1][1] += length
+    elif not adjacent_only:
+        ranges.append([offset, length])
+
+
+def index_subreddit_file(file_path, index_path, with_mentions=False):
+    """
+    Write a day -> byte ranges index of one subreddit JSONL file. Consecutive
+    lines of the same day are merged into one range. With with_mentions, a
+    ticker -> day -> byte ranges index of the posts mentioning each company in
+    ticker_to_company is written too, so company filtering becomes a lookup.
+    Skipped when the index was already built from the same file. Returns True
+    if the index was (re)built.
+    """
+    stamp = file_stamp(file_path)
+    if os.path.exists(index_path):
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        if index["stamp"] == stamp and ("mentions" in index) == with_mentions:
+            return False
+
+    decoder = get_jsonl_decoder()
+    days = {}
+    mentions = {}
+    # the range lists the previous non-empty line was added to
+    last_ranges = []
+    offset = 0
+    with open(file_path, "rb") as f:
+        for line in f:
+            length = len(line)
+            if line.strip():
+                # the day alone needs no full decode where the decoder can peek it
+                created_utc = None if with_mentions else decoder.peek_number(
+                    line, "created_utc"
+                )
+                if created_utc is None:
+                    parsed_line = decoder.decode(line)
+                    created_utc = parsed_line["created_utc"]
+                post_date = _utc_date(created_utc)
+                last_ranges = [days.setdefault(post_date, [])]
+                if with_mentions:
+                    for ticker in ticker_to_company:
+                        if _mentions_company(parsed_line, ticker):
+                            ticker_days = mentions.setdefault(ticker, {})
+                            last_ranges.append(ticker_days.setdefault(post_date, []))
+                for ranges in last_ranges:
+                    _add_range(ranges, offset, length)
+            else:
+                # empty lines are skipped on read; keep the current ranges whole
+                for ranges in last_ranges:
+                    _add_range(ranges, offset, length, adjacent_only=True)
+            offset += length
+
+    index = {"source": file_path, "stamp": stamp, "days": days}
+    if with_mentions:
+        index["companies"] = ticker_to_company
+        index["mentions"] = mentions
+
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    with atomic_write(index_path) as f:
+        json.dump(index, f)
+    return True
+
+
+def build_reddit_index(
+    data_path: Annotated[str, "Path to the reddit data folder."] = "reddit_data",
+    categories: Annotated[list, "Categories to index; all of them by default."] = None,
+    with_mentions: Annotated[
+        bool, "Also index company mentions in the company news categories."
+    ] = True,
+):
+    """
+    One-time indexer: record where each day's posts sit in every subreddit file,
+    so a day's fetch reads only that day's lines, and (for company news) which
+    posts mention each company. Returns the number of files (re)indexed per
+    category.
+    """
+    if categories is None:
+        categories = sorted(
+            name
+            for name in os.listdir(data_path)
+            if name != INDEX_DIR and os.path.isdir(os.path.join(data_path, name))
+        )
+
+    indexed = {}
+    for category in categories:
+        indexed[category] = 0
+        for data_file in sorted(os.listdir(os.path.join(data_path, category))):
+            if not data_file.endswith(".jsonl"):
+                continue
+            if index_subreddit_file(
+                os.path.join(data_path, category, data_file),
+                _index_path(data_path, category, data_file),
+                with_mentions=with_mentions and "company" in category,
+            ):
+                indexed[category] += 1
+    return indexed
+
+
+def _load_index(data_path, category, data_file):
+    """The index of a subreddit file, or None if missing or out of date."""
+    index_path = _index_path(data_path, category, data_file)
+    if not os.path.exists(index_path):
+        return None
+    stamp = file_stamp(os.path.join(data_path, category, data_file))
+
+    with _loaded_indexes_lock:
+        loaded = _loaded_indexes.get(index_path)
+    if loaded is None or loaded[0] != stamp:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        loaded = (index["stamp"], index)
+        with _loaded_indexes_lock:
+            _loaded_indexes[index_path] = loaded
+
+    return loaded[1] if loaded[0] == stamp else None
+
+
+def _index_ranges(data_path, category, data_file, query):
+    """
+    The day -> byte ranges to read from a subreddit file and whether they are
+    already filtered to posts mentioning the queried company. Ranges are None
+    when the file has no up-to-date index and must be scanned in full.
+    """
+    index = _load_index(data_path, category, data_file)
+    if index is None:
+        return None, False
+    if (
+        "company" in category
+        and query
+        and "mentions" in index
+        and index["companies"] == ticker_to_company
+    ):
+        return index["mentions"].get(query, {}), True
+    return index["days"], False
+
+
+def _read_lines(file_path, days=None, dates=None):
+    """
+    Yield the raw lines of a subreddit file. With a day index, only the byte
+    ranges of the requested dates are read; otherwise the whole file is.
+    """
+    with open(file_path, "rb") as f:
+        if days is None:
+            yield from f
+            return
+        for date in dates:
+            for offset, length in days.get(date, []):
+                f.seek(offset)
+                yield from f.read(length).splitlines()
+
+
+def _parse_post(line, category, query, dates, mentions_checked=False):
+    """
+    Decode one JSONL line into a post, or None if it is empty, not posted on one
+    of dates, or (for company news) does not mention the queried company.
+    """
+    # skip empty lines
+    if not line.strip():
+        return None
+
+    # reject posts from other dates on created_utc alone, before a full decode
+    decoder = get_jsonl_decoder()
+    created_utc = decoder.peek_number(line, "created_utc")
+    if created_utc is not None and _utc_date(created_utc) not in dates:
+        decoder.count_prefiltered()
+        return None
+
+    parsed_line = decoder.decode(line)
+
+    # select only lines that are from the dates
+    post_date = _utc_date(parsed_line["created_utc"])
+    if post_date not in dates:
+        return None
+
+    # if is company_news, check that the title or the content has the company's name (query) mentioned
+    if "company" in category and query and not mentions_checked:
+        if not _mentions_company(parsed_line, query):
+            return None
+
+    return {
+        "title": parsed_line["title"],
+        "content": parsed_line["selftext"],
+        "url": parsed_line["url"],
+        "upvotes": parsed_line["ups"],
+        "posted_date": post_date,
+    }
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -81,51 +321,17 @@ def fetch_top_from_category(
 
         all_content_curr_subreddit = []
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
+        # read only this day's lines when the file has an up-to-date day index
+        days, mentions_checked = _index_ranges(base_path, category, data_file, query)
+        file_path = os.path.join(base_path, category, data_file)
+        lines = _read_lines(file_path, days, [date])
+
+        for line in lines:
+            post = _parse_post(line, category, query, [date], mentions_checked)
+            if post is None:
+                continue
+
+            all_content_curr_subreddit.append(post)
 
         # sort all_content_curr_subreddit by upvote_ratio in descending order
         all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
@@ -133,3 +339,77 @@ def fetch_top_from_category(
         all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
     return all_content
+
+
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """
+    fetch_top_from_category for every day from start_date to end_date in one
+    pass: each subreddit file is read once for the whole window (only the
+    window's byte ranges when it has a day index), and a bounded min-heap per
+    (day, subreddit) keeps the top posts, so memory stays O(max_limit x days).
+    Posts are returned day by day, in the same order as calling
+    fetch_top_from_category for each day.
+    """
+    base_path = data_path
+
+    data_files = os.listdir(os.path.join(base_path, category))
+
+    if max_limit < len(data_files):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
+
+    limit_per_subreddit = max_limit // len(data_files)
+
+    dates = []
+    curr_date = datetime.strptime(start_date, "%Y-%m-%d")
+    while curr_date <= datetime.strptime(end_date, "%Y-%m-%d"):
+        dates.append(curr_date.strftime("%Y-%m-%d"))
+        curr_date += timedelta(days=1)
+    date_set = set(dates)
+
+    # (day, data_file) -> min-heap of (upvotes, -line number, post); the line
+    # number keeps earlier posts ahead on equal upvotes, like a stable sort
+    top_posts = {}
+    line_number = 0
+
+    for data_file in data_files:
+        # check if data_file is a .jsonl file
+        if not data_file.endswith(".jsonl"):
+            continue
+
+        days, mentions_checked = _index_ranges(base_path, category, data_file, query)
+        file_path = os.path.join(base_path, category, data_file)
+
+        for line in _read_lines(file_path, days, dates):
+            post = _parse_post(line, category, query, date_set, mentions_checked)
+            if post is None:
+                continue
+
+            line_number += 1
+            heap = top_posts.setdefault((post["posted_date"], data_file), [])
+            entry = (post["upvotes"], -line_number, post)
+            if len(heap) < limit_per_subreddit:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
+
+    all_content = []
+    for date in dates:
+        for data_file in data_files:
+            heap = top_posts.get((date, data_file), [])
+            all_content.extend(post for _, _, post in sorted(heap, reverse=True))
+
+    return all_content
@@ -1,12 +1,114 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
-import os
-from .config import get_config
+from .price_store import get_price_store
+from .yfin_cache import get_yfin_history_cache
+from .utils import locate_date
+
+
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
 
 
 class StockstatsUtils:
+    @staticmethod
+    def get_stock_data(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Load the full price history with a sorted datetime64 index and the Date
+        column as YYYY-mm-dd strings.
+        """
+        if not online:
+            try:
+                data = get_price_store(data_dir).get_frame(symbol).copy()
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+        else:
+            # Append-only cache that only downloads bars after the last cached date
+            data = get_yfin_history_cache().get_history(symbol).copy()
+            data["Date"] = data["Date"].dt.strftime("%Y-%m-%d")
+
+        return data
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -25,63 +127,13 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
-
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+        df = wrap(StockstatsUtils.get_stock_data(symbol, data_dir, online))
 
         df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        row = locate_date(df, curr_date)
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        if row is not None:
+            indicator_value = df[indicator].values[row]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
@@ -0,0 +1,166 @@
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Annotated, FrozenSet, List, Optional, Union
+
+import pandas as pd
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+# Unscheduled full-day NYSE closures that the holiday rules below cannot derive
+SPECIAL_CLOSURES = {
+    date(2012, 10, 29),  # Hurricane Sandy
+    date(2012, 10, 30),  # Hurricane Sandy
+    date(2018, 12, 5),  # National Day of Mourning, George H. W. Bush
+    date(2025, 1, 9),  # National Day of Mourning, Jimmy Carter
+}
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday of a month; n=-1 means the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + timedelta(days=offset + 7 * (n - 1))
+    if month == 12:
+        last = date(year, 12, 31)
+    else:
+        last = date(year, month + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: Annotated[int, "calendar year"]) -> FrozenSet[date]:
+    """Full-day NYSE holidays for a year, derived from the exchange's rules."""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        _observed(date(year, 12, 25)),  # Christmas Day
+    }
+    # New Year's Day falling on a Saturday is not observed on the prior Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays |= {day for day in SPECIAL_CLOSURES if day.year == year}
+    return frozenset(holidays)
+
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.date()
+    return value
+
+
+class TradingCalendar:
+    """
+    Exchange trading calendar that yields only session dates.
+
+    Sessions come from the NYSE holiday rules in this module. When a sorted set
+    of known sessions is supplied (e.g. the dates of a cached price history), it
+    takes precedence inside the range it covers, so unscheduled closures seen in
+    the data are honoured as well.
+    """
+
+    def __init__(
+        self,
+        known_sessions: Annotated[
+            Optional[pd.DatetimeIndex], "observed session dates, e.g. a price index"
+        ] = None,
+    ):
+        self._known = None
+        if known_sessions is not None and len(known_sessions) > 0:
+            known = pd.DatetimeIndex(known_sessions).normalize()
+            self._known = known.unique().sort_values()
+
+    @classmethod
+    def from_price_history(cls, data: pd.DataFrame) -> "TradingCalendar":
+        """Build a calendar from a date-indexed price frame."""
+        return cls(known_sessions=data.index)
+
+    def is_session(self, day: DateLike) -> bool:
+        day = _to_date(day)
+        known = self._known
+        if known is not None and known[0].date() <= day <= known[-1].date():
+            pos = known.searchsorted(pd.Timestamp(day))
+            return pos < len(known) and known[pos].date() == day
+        return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+    def sessions(
+        self,
+        start_date: Annotated[DateLike, "first date of the range (inclusive)"],
+        end_date: Annotated[DateLike, "last date of the range (inclusive)"],
+    ) -> List[str]:
+        """Session dates between start_date and end_date, oldest first, as YYYY-mm-dd."""
+        start, end = _to_date(start_date), _to_date(end_date)
+        days = pd.bdate_range(start, end) if start <= end else []
+        return [day.strftime("%Y-%m-%d") for day in days if self.is_session(day)]
+
+    def next_session(self, day: DateLike) -> date:
+        """The first session on or after day."""
+        day = _to_date(day)
+        while not self.is_session(day):
+            day += timedelta(days=1)
+        return day
+
+    def previous_session(self, day: DateLike) -> date:
+        """The last session on or before day."""
+        day = _to_date(day)
+        while not self.is_session(day):
+            day -= timedelta(days=1)
+        return day
+
+    def lookback_sessions(
+        self,
+        curr_date: Annotated[DateLike, "current date, yyyy-mm-dd"],
+        look_back_days: Annotated[int, "how many calendar days to look back"],
+    ) -> List[str]:
+        """Sessions in the calendar-day lookback window ending at curr_date, newest first."""
+        end = _to_date(curr_date)
+        start = end - timedelta(days=look_back_days)
+        return self.sessions(start, end)[::-1]
+
+
+_default_calendar = TradingCalendar()
+
+
+def get_trading_calendar(
+    known_sessions: Annotated[
+        Optional[pd.DatetimeIndex], "observed session dates, e.g. a price index"
+    ] = None,
+) -> TradingCalendar:
+    """Return the rule-based calendar, refined by observed sessions when given."""
+    if known_sessions is None or len(known_sessions) == 0:
+        return _default_calendar
+    return TradingCalendar(known_sessions=known_sessions)
@@ -1,8 +1,18 @@
 import os
 import json
+import threading
 import pandas as pd
-from datetime import date, timedelta, datetime
-from typing import Annotated
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Annotated, Optional
+from langchain_core.callbacks.manager import (
+    adispatch_custom_event,
+    dispatch_custom_event,
+)
+from .trading_calendar import get_trading_calendar
+
+# LangChain custom event dispatched for every retried request
+RETRY_EVENT = "request_retry"
 
 SavePathType = Annotated[str, "File path to save data. If None, data is not saved."]
 
@@ -27,13 +37,97 @@ def decorate_all_methods(decorator):
 
 
 def get_next_weekday(date):
+    """Return the first trading session on or after date, skipping weekends and exchange holidays."""
 
     if not isinstance(date, datetime):
         date = datetime.strptime(date, "%Y-%m-%d")
 
-    if date.weekday() >= 5:
-        days_to_add = 7 - date.weekday()
-        next_weekday = date + timedelta(days=days_to_add)
-        return next_weekday
-    else:
-        return date
+    next_session = get_trading_calendar().next_session(date)
+    return datetime.combine(next_session, date.time())
+
+
+def index_by_date(data: pd.DataFrame, dates=None) -> pd.DataFrame:
+    """
+    Give a price frame a sorted datetime64 index so date lookups can use binary
+    search. The index is built from ``dates`` or from the frame's Date column.
+    """
+    if dates is None:
+        dates = data["Date"]
+    index = pd.DatetimeIndex(pd.to_datetime(dates, utc=False))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    data.index = index.normalize()
+    if not data.index.is_monotonic_increasing:
+        data.sort_index(kind="stable", inplace=True)
+    return data
+
+
+def locate_date(data: pd.DataFrame, date) -> Optional[int]:
+    """Return the row position of ``date`` in a date-indexed frame, or None."""
+    target = pd.Timestamp(date).normalize()
+    pos = data.index.searchsorted(target, side="left")
+    if pos < len(data.index) and data.index[pos] == target:
+        return int(pos)
+    return None
+
+
+def slice_date_range(
+    data: pd.DataFrame, start_date=None, end_date=None, inclusive_end: bool = True
+) -> pd.DataFrame:
+    """Return the rows of a date-indexed frame between start_date and end_date."""
+    lo = 0
+    hi = len(data.index)
+    if start_date is not None:
+        lo = data.index.searchsorted(pd.Timestamp(start_date), side="left")
+    if end_date is not None:
+        side = "right" if inclusive_end else "left"
+        hi = data.index.searchsorted(pd.Timestamp(end_date), side=side)
+    return data.iloc[lo:hi]
+
+
+def file_stamp(path) -> list:
+    """[mtime_ns, size] of a file, used to tell whether a derived copy is stale."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def temp_path(path) -> str:
+    """A sibling of path private to this process and thread, to build it in."""
+    return f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+
+
+@contextmanager
+def atomic_write(path, mode="w"):
+    """
+    Open a temporary sibling of path for writing and move it over path once
+    the block completes, so readers never see a partially written file.
+    """
+    tmp_path = temp_path(path)
+    try:
+        newline = None if "b" in mode else ""
+        with open(tmp_path, mode, newline=newline) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def report_retry(source: str) -> None:
+    """
+    Tell the callbacks of the graph run this call belongs to (RunInstrumentation
+    counts them per node) that a request to source is being retried.
+    """
+    try:
+        dispatch_custom_event(RETRY_EVENT, {"source": source})
+    except RuntimeError:
+        # not inside a run, so there is nobody to report to
+        pass
+
+
+async def areport_retry(source: str) -> None:
+    """Async report_retry."""
+    try:
+        await adispatch_custom_event(RETRY_EVENT, {"source": source})
+    except RuntimeError:
+        pass
@@ -0,0 +1,347 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Annotated, Dict, List, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .frame_cache import get_frame_cache
+from .utils import (
+    atomic_write,
+    file_stamp,
+    index_by_date,
+    locate_date,
+    slice_date_range,
+)
+
+# Corporate action columns downloaded alongside the prices, as Ticker.history has
+ACTION_COLUMNS = ["Dividends", "Stock Splits"]
+
+
+class YFinHistoryCache:
+    """
+    Append-only, per-symbol cache of the online YFinance daily history.
+
+    Each symbol is kept in ``{cache_dir}/{symbol}-YFin-data.csv``. On refresh only
+    the bars after the last cached date are downloaded and merged in; the last
+    cached bar is fetched again so a partial or revised bar gets replaced. Because
+    prices are dividend/split adjusted, a full re-download is done whenever that
+    overlapping bar no longer matches what was cached. The last-refresh time is
+    recorded per symbol, so repeated calls within ``refresh_interval`` are served
+    from the process-wide frame cache without touching disk or network.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Annotated[str, "directory where the per-symbol history is stored"],
+        history_years: Annotated[int, "years of history for a fresh download"] = 15,
+        refresh_interval: Annotated[
+            timedelta, "how long a refreshed history is considered current"
+        ] = timedelta(hours=1),
+    ):
+        self.cache_dir = cache_dir
+        self.history_years = history_years
+        self.refresh_interval = refresh_interval
+        self._last_refresh: Dict[str, datetime] = {}
+        # guards the shared state above; never held across a download
+        self._lock = threading.Lock()
+        # serializes refreshes of one symbol, so it is downloaded only once
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+
+    def _data_file(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data.csv")
+
+    def _meta_file(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data.meta.json")
+
+    @staticmethod
+    def _normalize(data: pd.DataFrame) -> pd.DataFrame:
+        data = data.reset_index()
+        if not data.empty:
+            data["Date"] = pd.to_datetime(data["Date"]).dt.tz_localize(None)
+            data["Date"] = data["Date"].dt.normalize()
+            index_by_date(data)
+        return data
+
+    @classmethod
+    def _download(cls, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        data = yf.download(
+            symbol,
+            start=start_date,
+            end=end_date,
+            multi_level_index=False,
+            progress=False,
+            auto_adjust=True,
+            actions=True,
+        )
+        return cls._normalize(data)
+
+    @classmethod
+    def _download_many(
+        cls, symbols: List[str], start_date: str, end_date: str
+    ) -> Dict[str, pd.DataFrame]:
+        """Download several symbols in one batched multi-symbol request."""
+        data = yf.download(
+            symbols,
+            start=start_date,
+            end=end_date,
+            group_by="ticker",
+            progress=False,
+            auto_adjust=True,
+            actions=True,
+            threads=True,
+        )
+        frames = {}
+        for symbol in symbols:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    frames[symbol] = pd.DataFrame()
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+            # days the symbol did not trade have no prices (but zero actions)
+            if "Close" in frame:
+                frame = frame.dropna(subset=["Close"])
+            frames[symbol] = cls._normalize(frame)
+        return frames
+
+    def _read_disk(self, symbol: str) -> Optional[pd.DataFrame]:
+        data_file = self._data_file(symbol)
+        if not os.path.exists(data_file):
+            return None
+        data = pd.read_csv(data_file)
+        # histories cached before the actions were downloaded are fetched again
+        if any(column not in data for column in ACTION_COLUMNS):
+            return None
+        data["Date"] = pd.to_datetime(data["Date"])
+        return index_by_date(data)
+
+    def _read_last_refresh(self, symbol: str) -> Optional[datetime]:
+        meta_file = self._meta_file(symbol)
+        if not os.path.exists(meta_file):
+            return None
+        with open(meta_file, "r") as f:
+            return datetime.fromisoformat(json.load(f)["last_refresh"])
+
+    def _write(self, symbol: str, data: pd.DataFrame) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_file = self._data_file(symbol)
+        with atomic_write(data_file) as f:
+            data.to_csv(f, index=False, date_format="%Y-%m-%d")
+
+    def _write_last_refresh(self, symbol: str, refreshed_at: datetime) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._meta_file(symbol), "w") as f:
+            json.dump({"last_refresh": refreshed_at.isoformat()}, f)
+
+    def _window(self) -> Tuple[str, str]:
+        """Start of a full download and the (exclusive) end date of any download."""
+        today = pd.Timestamp.today().normalize()
+        full_start = today - pd.DateOffset(years=self.history_years)
+        return full_start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _merge(cached: pd.DataFrame, delta: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Append delta to cached, or return None if the history was re-adjusted."""
+        if delta.empty:
+            return cached
+
+        last_bar = cached.iloc[-1]
+        overlap = locate_date(delta, last_bar["Date"])
+        adjusted_since = overlap is not None and abs(
+            delta["Close"].iloc[overlap] - last_bar["Close"]
+        ) > 1e-6 * max(abs(last_bar["Close"]), 1.0)
+        if adjusted_since:
+            return None
+
+        kept = slice_date_range(cached, end_date=delta.index[0], inclusive_end=False)
+        return pd.concat([kept, delta])
+
+    def _refresh(self, symbol: str, cached: Optional[pd.DataFrame]) -> pd.DataFrame:
+        full_start, end_date = self._window()
+
+        if cached is not None and not cached.empty:
+            start_date = cached.index[-1].strftime("%Y-%m-%d")
+            if start_date >= end_date:
+                return cached
+
+            merged = self._merge(cached, self._download(symbol, start_date, end_date))
+            if merged is not None:
+                return merged
+
+        # nothing cached yet, or history was re-adjusted: download the full window
+        return self._download(symbol, full_start, end_date)
+
+    @staticmethod
+    def _key(symbol: str) -> tuple:
+        return (symbol, "yfinance", "adjusted")
+
+    def _lookup(
+        self, symbol: str, now: datetime
+    ) -> Tuple[Optional[pd.DataFrame], bool]:
+        """Return the cached history and whether it is within refresh_interval."""
+        frame_cache = get_frame_cache()
+        cached = frame_cache.get(self._key(symbol))
+        last_refresh = self._last_refresh.get(symbol)
+
+        if cached is None:
+            cached = self._read_disk(symbol)
+            last_refresh = self._read_last_refresh(symbol)
+            if cached is not None:
+                frame_cache.put(self._key(symbol), cached)
+                if last_refresh is not None:
+                    self._last_refresh[symbol] = last_refresh
+
+        fresh = (
+            cached is not None
+            and last_refresh is not None
+            and now - last_refresh < self.refresh_interval
+        )
+        return cached, fresh
+
+    def _save(
+        self,
+        symbol: str,
+        cached: Optional[pd.DataFrame],
+        data: pd.DataFrame,
+        now: datetime,
+    ) -> None:
+        if data is not cached:
+            self._write(symbol, data)
+        self._write_last_refresh(symbol, now)
+        get_frame_cache().put(self._key(symbol), data)
+        self._last_refresh[symbol] = now
+
+    def get_history(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        download_if_missing: Annotated[
+            bool, "do the full-history download when nothing is cached yet"
+        ] = True,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Return the full cached daily history, fetching only new bars if stale.
+        Returns None when nothing is cached and download_if_missing is False.
+        """
+        now = datetime.now()
+
+        with self._symbol_lock(symbol):
+            with self._lock:
+                cached, fresh = self._lookup(symbol, now)
+            if fresh:
+                return cached
+            if cached is None and not download_if_missing:
+                return None
+
+            # other symbols can be looked up and downloaded meanwhile
+            data = self._refresh(symbol, cached)
+            # a failed or rate-limited download comes back empty; cache nothing
+            # and keep serving what was cached
+            if data.empty:
+                return data if cached is None else cached
+            with self._lock:
+                self._save(symbol, cached, data, now)
+            return data
+
+    def history_stamp(
+        self, symbol: Annotated[str, "ticker symbol of the company"]
+    ) -> Optional[list]:
+        """[mtime_ns, size] of the symbol's cached history file, if there is one."""
+        data_file = self._data_file(symbol)
+        return file_stamp(data_file) if os.path.exists(data_file) else None
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+
+    def refresh_many(
+        self,
+        symbols: Annotated[List[str], "ticker symbols to bring up to date"],
+        batch_size: Annotated[int, "symbols per multi-symbol request"] = 50,
+    ) -> Dict[str, int]:
+        """
+        Bring many symbols up to date with batched multi-symbol downloads.
+
+        Stale symbols are grouped by the first date they need, so an unseen
+        universe costs one full-history request per batch and a nightly top-up
+        costs one short request per batch. Returns the cached row count per symbol.
+        """
+        now = datetime.now()
+        full_start, end_date = self._window()
+
+        with self._lock:
+            states = {symbol: self._lookup(symbol, now) for symbol in symbols}
+
+        # group stale symbols by the date their download has to start from
+        groups: Dict[str, List[str]] = {}
+        for symbol, (cached, fresh) in states.items():
+            if fresh:
+                continue
+            if cached is not None and not cached.empty:
+                start_date = cached.index[-1].strftime("%Y-%m-%d")
+            else:
+                start_date = full_start
+            groups.setdefault(start_date, []).append(symbol)
+
+        results: Dict[str, pd.DataFrame] = {}
+        needs_full: List[str] = []
+        for start_date, group in groups.items():
+            if start_date >= end_date:
+                for symbol in group:
+                    results[symbol] = states[symbol][0]
+                continue
+
+            for i in range(0, len(group), batch_size):
+                batch = group[i : i + batch_size]
+                downloaded = self._download_many(batch, start_date, end_date)
+                for symbol in batch:
+                    cached = states[symbol][0]
+                    delta = downloaded.get(symbol, pd.DataFrame())
+                    if cached is None or cached.empty:
+                        results[symbol] = delta
+                        continue
+                    merged = self._merge(cached, delta)
+                    if merged is None:
+                        needs_full.append(symbol)
+                    else:
+                        results[symbol] = merged
+
+        # symbols whose history was re-adjusted since it was cached
+        for i in range(0, len(needs_full), batch_size):
+            batch = needs_full[i : i + batch_size]
+            results.update(self._download_many(batch, full_start, end_date))
+
+        with self._lock:
+            for symbol, data in results.items():
+                # an unknown or delisted symbol comes back empty; cache nothing
+                if not data.empty:
+                    self._save(symbol, states[symbol][0], data, now)
+
+        summary = {}
+        for symbol in symbols:
+            data = results.get(symbol, states[symbol][0])
+            summary[symbol] = 0 if data is None else len(data)
+        return summary
+
+
+_caches: Dict[str, YFinHistoryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_yfin_history_cache() -> YFinHistoryCache:
+    """Return the process-wide YFinHistoryCache for the configured cache dir."""
+    config = get_config()
+    cache_dir = config["data_cache_dir"]
+    with _caches_lock:
+        if cache_dir not in _caches:
+            _caches[cache_dir] = YFinHistoryCache(
+                cache_dir,
+                refresh_interval=timedelta(
+                    minutes=config["online_price_refresh_minutes"]
+                ),
+            )
+        return _caches[cache_dir]
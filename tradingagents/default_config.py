@@ -26,15 +26,59 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    "price_store_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "dataflows/data_cache/price_store",
+    ),
+    "indicator_store_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "dataflows/data_cache/indicator_store",
+    ),
+    "news_cache_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "dataflows/data_cache/news_cache",
+    ),
+    "online_price_refresh_minutes": 60,
+    "news_cache_ttl_minutes": 360,
+    "frame_cache_max_mb": 512,
+    "async_max_connections": 20,
+    "async_blocking_workers": 8,
+    "openai_max_connections": 20,
+    "openai_max_keepalive_connections": 20,
+    "jsonl_decoder": "auto",  # auto / orjson / msgspec / json
+    "google_news_requests_per_second": 0.5,
+    "google_news_burst": 3,
+    "google_news_max_concurrency": 4,
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "o4-mini",      # Reasoning model for complex analysis
     "quick_think_llm": "gpt-5-mini",  # Fast model for quick tasks (Updated to GPT-5)
     "backend_url": "https://api.openai.com/v1",
+    # LLM response cache: None (off), "record" or "replay"
+    "llm_cache_mode": None,
+    "llm_cache_path": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "dataflows/data_cache/llm_cache.sqlite",
+    ),
+    "llm_cache_max_mb": 1024,
+    # USD per million (input, output) tokens, for the per-node cost accounting
+    "llm_prices": {
+        "gpt-5": (1.25, 10.0),
+        "gpt-5-mini": (0.25, 2.0),
+        "gpt-5-nano": (0.05, 0.4),
+        "gpt-4o": (2.5, 10.0),
+        "gpt-4o-mini": (0.15, 0.6),
+        "gpt-4.1": (2.0, 8.0),
+        "gpt-4.1-mini": (0.4, 1.6),
+        "o3": (2.0, 8.0),
+        "o4-mini": (1.1, 4.4),
+    },
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Stream LLM tokens from the agent nodes to the CLI as they are generated
+    "stream_llm_tokens": True,
     # Tool settings
     "online_tools": True,
 }
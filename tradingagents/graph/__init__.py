@@ -6,6 +6,8 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .llm_cache import SQLiteLLMCache, LLMCacheMiss
+from .instrumentation import RunInstrumentation
 
 __all__ = [
     "TradingAgentsGraph",
@@ -14,4 +16,7 @@ __all__ = [
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "SQLiteLLMCache",
+    "LLMCacheMiss",
+    "RunInstrumentation",
 ]
@@ -0,0 +1,266 @@
+# TradingAgents/graph/instrumentation.py
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from tradingagents.dataflows.utils import RETRY_EVENT
+
+NODE_METRICS = (
+    "calls",
+    "wall_seconds",
+    "llm_calls",
+    "cache_hits",
+    "llm_seconds",
+    "prompt_tokens",
+    "completion_tokens",
+    "cost_usd",
+    "tool_calls",
+    "tool_seconds",
+    "tool_input_bytes",
+    "tool_output_bytes",
+    "retries",
+    "errors",
+)
+
+
+def _payload_bytes(payload: Any) -> int:
+    content = getattr(payload, "content", payload)
+    if not isinstance(content, str):
+        content = str(content)
+    return len(content.encode("utf-8"))
+
+
+def _is_cache_hit(generation) -> bool:
+    """Whether a generation was served from an LLM cache rather than the API."""
+    if (generation.generation_info or {}).get("cache_hit"):
+        return True
+    # LangChain zeroes the cost of the generations it replays from a cache
+    message = getattr(generation, "message", None)
+    usage = getattr(message, "usage_metadata", None) or {}
+    return usage.get("total_cost") == 0
+
+
+class RunInstrumentation(BaseCallbackHandler):
+    """
+    Callback handler that accounts one propagate per graph node.
+
+    LangGraph tags every callback fired inside a node with the node's name
+    (``langgraph_node``), so passing this handler in the graph config covers
+    the node runs, the LLM calls and the tool calls made within them. Records
+    wall time, prompt/completion tokens, cost (for models with a price in
+    ``prices``), tool payload bytes, retries and errors. Responses served from
+    an LLM cache are counted as cache hits, with no tokens or cost billed.
+    Retries are the ``RETRY_EVENT`` custom events the data layer dispatches
+    for retried OpenAI and Google News requests.
+    """
+
+    def __init__(
+        self,
+        prices: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        """
+        Args:
+            prices: model name -> (input, output) USD per million tokens
+        """
+        self.prices = prices or {}
+        self.nodes: Dict[str, Dict[str, float]] = {}
+        self._run_nodes: Dict[UUID, str] = {}
+        self._started: Dict[UUID, Tuple[float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _node(
+        self, run_id: UUID, parent_run_id: Optional[UUID], metadata=None
+    ) -> str:
+        node = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            if node is None:
+                node = self._run_nodes.get(run_id) or self._run_nodes.get(
+                    parent_run_id, "unknown"
+                )
+            self._run_nodes[run_id] = node
+        return node
+
+    def _add(self, node: str, **values: float) -> None:
+        with self._lock:
+            metrics = self.nodes.setdefault(node, dict.fromkeys(NODE_METRICS, 0))
+            for name, value in values.items():
+                metrics[name] += value
+
+    def _start(self, run_id: UUID, model: Optional[str] = None) -> None:
+        with self._lock:
+            self._started[run_id] = (time.perf_counter(), model)
+
+    def _stop(self, run_id: UUID) -> Tuple[float, Optional[str]]:
+        with self._lock:
+            started, model = self._started.pop(run_id, (None, None))
+        elapsed = time.perf_counter() - started if started is not None else 0.0
+        return elapsed, model
+
+    # Node runs
+
+    def on_chain_start(
+        self, serialized, inputs, *, run_id, parent_run_id=None, metadata=None, **kwargs
+    ) -> None:
+        node = self._node(run_id, parent_run_id, metadata)
+        # the node's own run carries its name; nested chains inside it don't
+        if kwargs.get("name") == node:
+            self._start(run_id)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        with self._lock:
+            is_node_run = run_id in self._started
+            node = self._run_nodes.get(run_id, "unknown")
+        if is_node_run:
+            elapsed, _ = self._stop(run_id)
+            self._add(node, calls=1, wall_seconds=elapsed)
+
+    def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+        self.on_chain_end(None, run_id=run_id)
+
+    def on_custom_event(
+        self, name, data, *, run_id, metadata=None, **kwargs
+    ) -> None:
+        if name == RETRY_EVENT:
+            self._add(self._node(run_id, None, metadata), retries=1)
+
+    # LLM calls
+
+    def on_chat_model_start(
+        self,
+        serialized,
+        messages,
+        *,
+        run_id,
+        parent_run_id=None,
+        metadata=None,
+        **kwargs,
+    ) -> None:
+        self.on_llm_start(
+            serialized,
+            [],
+            run_id=run_id,
+            parent_run_id=parent_run_id,
+            metadata=metadata,
+            **kwargs,
+        )
+
+    def on_llm_start(
+        self,
+        serialized,
+        prompts,
+        *,
+        run_id,
+        parent_run_id=None,
+        metadata=None,
+        **kwargs,
+    ) -> None:
+        self._node(run_id, parent_run_id, metadata)
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name")
+        if model is None:
+            model = (metadata or {}).get("ls_model_name")
+        self._start(run_id, model)
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs) -> None:
+        elapsed, model = self._stop(run_id)
+        with self._lock:
+            node = self._run_nodes.get(run_id, "unknown")
+
+        generations = [g for gens in response.generations for g in gens]
+        if generations and all(map(_is_cache_hit, generations)):
+            # nothing was billed for a replayed response
+            self._add(node, cache_hits=1, llm_seconds=elapsed)
+            return
+
+        prompt_tokens = completion_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+                response_metadata = getattr(message, "response_metadata", None) or {}
+                model = response_metadata.get("model_name") or model
+        llm_output = response.llm_output or {}
+        if not prompt_tokens and not completion_tokens:
+            token_usage = llm_output.get("token_usage") or {}
+            prompt_tokens = token_usage.get("prompt_tokens", 0)
+            completion_tokens = token_usage.get("completion_tokens", 0)
+
+        cost = 0.0
+        price = self._price(llm_output.get("model_name") or model)
+        if price is not None:
+            cost = (prompt_tokens * price[0] + completion_tokens * price[1]) / 1e6
+
+        self._add(
+            node,
+            llm_calls=1,
+            llm_seconds=elapsed,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost_usd=cost,
+        )
+
+    def _price(self, model: Optional[str]) -> Optional[Tuple[float, float]]:
+        if not model:
+            return None
+        if model in self.prices:
+            return self.prices[model]
+        # dated snapshots, e.g. gpt-4o-mini-2024-07-18, use their base model's price
+        matches = [name for name in self.prices if model.startswith(f"{name}-")]
+        return self.prices[max(matches, key=len)] if matches else None
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        elapsed, _ = self._stop(run_id)
+        with self._lock:
+            node = self._run_nodes.get(run_id, "unknown")
+        self._add(node, llm_seconds=elapsed, errors=1)
+
+    # Tool calls
+
+    def on_tool_start(
+        self,
+        serialized,
+        input_str,
+        *,
+        run_id,
+        parent_run_id=None,
+        metadata=None,
+        **kwargs,
+    ) -> None:
+        node = self._node(run_id, parent_run_id, metadata)
+        self._start(run_id)
+        self._add(node, tool_input_bytes=_payload_bytes(input_str))
+
+    def on_tool_end(self, output, *, run_id, **kwargs) -> None:
+        elapsed, _ = self._stop(run_id)
+        with self._lock:
+            node = self._run_nodes.get(run_id, "unknown")
+        self._add(
+            node,
+            tool_calls=1,
+            tool_seconds=elapsed,
+            tool_output_bytes=_payload_bytes(output),
+        )
+
+    def on_tool_error(self, error, *, run_id, **kwargs) -> None:
+        elapsed, _ = self._stop(run_id)
+        with self._lock:
+            node = self._run_nodes.get(run_id, "unknown")
+        self._add(node, tool_calls=1, tool_seconds=elapsed, errors=1)
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-node metrics plus their totals, as plain JSON-serializable dicts."""
+        with self._lock:
+            nodes = {node: dict(metrics) for node, metrics in self.nodes.items()}
+        total = dict.fromkeys(NODE_METRICS, 0)
+        for metrics in nodes.values():
+            for name, value in metrics.items():
+                total[name] += value
+        return {"nodes": nodes, "total": total}
@@ -0,0 +1,216 @@
+# TradingAgents/graph/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+LLM_CACHE_MODES = ("record", "replay")
+
+
+class LLMCacheMiss(KeyError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    Disk-backed LLM response cache for the quick and deep thinking LLMs.
+
+    LangChain keys each call by the serialized messages and the model's
+    ``llm_string`` (model name, sampling params and bound tools), so a rerun
+    of the same (ticker, date) only pays for calls whose inputs changed.
+
+    Modes:
+        record: serve recorded responses and record new ones.
+        replay: serve recorded responses only; a call that was never recorded
+            raises LLMCacheMiss, so a replay cannot silently hit the API.
+
+    The least recently used entries are evicted once the stored responses
+    exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "record",
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.path = path
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    llm_string TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used)"
+            )
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: str) -> None:
+        if mode not in LLM_CACHE_MODES:
+            raise ValueError(
+                f"LLM cache mode {mode} is not supported. Please choose from: {LLM_CACHE_MODES}"
+            )
+        self._mode = mode
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _dump(return_val: Sequence[Generation]) -> str:
+        generations = []
+        for generation in return_val:
+            if isinstance(generation, ChatGeneration):
+                generations.append(
+                    {
+                        "message": message_to_dict(generation.message),
+                        "generation_info": generation.generation_info,
+                    }
+                )
+            else:
+                generations.append(
+                    {
+                        "text": generation.text,
+                        "generation_info": generation.generation_info,
+                    }
+                )
+        return json.dumps(generations)
+
+    @staticmethod
+    def _load(response: str) -> list:
+        generations = []
+        for generation in json.loads(response):
+            # marks the replay, so run accounting does not bill it again
+            generation_info = {
+                **(generation["generation_info"] or {}),
+                "cache_hit": True,
+            }
+            if "message" in generation:
+                generations.append(
+                    ChatGeneration(
+                        message=messages_from_dict([generation["message"]])[0],
+                        generation_info=generation_info,
+                    )
+                )
+            else:
+                generations.append(
+                    Generation(
+                        text=generation["text"],
+                        generation_info=generation_info,
+                    )
+                )
+        return generations
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[list]:
+        key = self._key(prompt, llm_string)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE llm_cache SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if row is not None:
+            return self._load(row[0])
+        if self.mode == "replay":
+            raise LLMCacheMiss(
+                f"No recorded LLM response for this call (llm: {llm_string[:200]})"
+            )
+        return None
+
+    def update(
+        self, prompt: str, llm_string: str, return_val: Sequence[Generation]
+    ) -> None:
+        if self.mode == "replay":
+            return
+        response = self._dump(return_val)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._key(prompt, llm_string),
+                    llm_string,
+                    response,
+                    len(response),
+                    time.time(),
+                ),
+            )
+            self.writes += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until under max_bytes."""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY last_used"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts of this process and the size of the stored responses."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
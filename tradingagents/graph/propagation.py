@@ -41,9 +41,20 @@ class Propagator:
             "news_report": "",
         }
 
-    def get_graph_args(self) -> Dict[str, Any]:
-        """Get arguments for the graph invocation."""
+    def get_graph_args(self, callbacks=None, stream_tokens=False) -> Dict[str, Any]:
+        """Get arguments for the graph invocation.
+
+        Args:
+            callbacks: Optional callback handlers attached to every node,
+                e.g. a RunInstrumentation
+            stream_tokens: Also stream LLM tokens from every agent node. The
+                graph then yields ("values", state) and
+                ("messages", (message_chunk, metadata)) tuples.
+        """
+        config = {"recursion_limit": self.max_recur_limit}
+        if callbacks:
+            config["callbacks"] = callbacks
         return {
-            "stream_mode": "values",
-            "config": {"recursion_limit": self.max_recur_limit},
+            "stream_mode": ["values", "messages"] if stream_tokens else "values",
+            "config": config,
         }
@@ -22,12 +22,18 @@ from tradingagents.agents.utils.agent_states import (
     RiskDebateState,
 )
 from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.openai_clients import (
+    openai_async_http_client,
+    openai_http_client,
+)
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .llm_cache import SQLiteLLMCache
+from .instrumentation import RunInstrumentation
 
 
 class TradingAgentsGraph:
@@ -58,16 +64,27 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
+        # Opt-in response cache shared by the quick and deep thinking LLMs
+        self.llm_cache = self._create_llm_cache()
+
         # Initialize LLMs
         if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            # With a base_url set, langchain-openai leaves token usage out of
+            # streamed responses unless stream_usage is asked for explicitly
+            stream_usage = bool(self.config.get("stream_llm_tokens", False))
+            # Shared clients that report the SDK's retries to the run accounting
+            http_clients = dict(
+                http_client=openai_http_client(),
+                http_async_client=openai_async_http_client(),
+            )
+            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache, stream_usage=stream_usage, **http_clients)
+            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache, stream_usage=stream_usage, **http_clients)
         elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache)
+            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache)
         elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
+            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"], cache=self.llm_cache)
+            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"], cache=self.llm_cache)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
         
@@ -110,6 +127,23 @@ class TradingAgentsGraph:
         # Set up the graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
 
+    def _create_llm_cache(self) -> Optional[SQLiteLLMCache]:
+        """Create the LLM response cache if llm_cache_mode is set."""
+        mode = self.config.get("llm_cache_mode")
+        if not mode:
+            return None
+        return SQLiteLLMCache(
+            self.config["llm_cache_path"],
+            mode=mode,
+            max_bytes=self.config["llm_cache_max_mb"] * 1024 * 1024,
+        )
+
+    def set_llm_cache_mode(self, mode):
+        """Switch the LLM response cache to "record" or "replay" for the next run."""
+        if self.llm_cache is None:
+            raise ValueError("LLM response cache is disabled; set llm_cache_mode")
+        self.llm_cache.mode = mode
+
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
         return {
@@ -118,9 +152,11 @@ class TradingAgentsGraph:
                     # online tools
                     self.toolkit.get_YFin_data_online,
                     self.toolkit.get_stockstats_indicators_report_online,
+                    self.toolkit.get_stockstats_indicators_batch_report_online,
                     # offline tools
                     self.toolkit.get_YFin_data,
                     self.toolkit.get_stockstats_indicators_report,
+                    self.toolkit.get_stockstats_indicators_batch_report,
                 ]
             ),
             "social": ToolNode(
@@ -151,44 +187,91 @@ class TradingAgentsGraph:
                     self.toolkit.get_simfin_balance_sheet,
                     self.toolkit.get_simfin_cashflow,
                     self.toolkit.get_simfin_income_stmt,
+                    self.toolkit.get_simfin_fundamentals_snapshot,
+                    self.toolkit.get_simfin_fundamentals_screen,
                 ]
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def create_instrumentation(self) -> RunInstrumentation:
+        """Create the per-node accounting handler for one propagate."""
+        return RunInstrumentation(self.config.get("llm_prices"))
 
+    def _start_run(self, company_name, trade_date):
+        """Set up one propagate: the initial state, graph args and accounting."""
         self.ticker = company_name
 
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
+        instrumentation = self.create_instrumentation()
+        args = self.propagator.get_graph_args(callbacks=[instrumentation])
+        return init_agent_state, args, instrumentation
+
+    @staticmethod
+    def _trace_chunk(trace, chunk):
+        """Debug mode: print a streamed chunk's last message and keep it."""
+        if len(chunk["messages"]) == 0:
+            pass
+        else:
+            chunk["messages"][-1].pretty_print()
+            trace.append(chunk)
+
+    def _finish_run(self, trade_date, final_state, instrumentation):
+        """Post-process one propagate's final state into (state, decision)."""
+        # Per-node time, token and cost accounting of this run
+        final_state["run_metrics"] = instrumentation.summary()
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state
+        self._log_state(trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    def propagate(self, company_name, trade_date):
+        """Run the trading agents graph for a company on a specific date."""
+        init_agent_state, args, instrumentation = self._start_run(
+            company_name, trade_date
+        )
 
         if self.debug:
             # Debug mode with tracing
             trace = []
             for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                self._trace_chunk(trace, chunk)
 
             final_state = trace[-1]
         else:
             # Standard mode without tracing
             final_state = self.graph.invoke(init_agent_state, **args)
 
-        # Store current state for reflection
-        self.curr_state = final_state
+        return self._finish_run(trade_date, final_state, instrumentation)
 
-        # Log state
-        self._log_state(trade_date, final_state)
+    async def apropagate(self, company_name, trade_date):
+        """
+        Async propagate: runs the graph with ainvoke so the tool nodes await the
+        async data tools and overlap their network I/O.
+        """
+        init_agent_state, args, instrumentation = self._start_run(
+            company_name, trade_date
+        )
 
-        # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                self._trace_chunk(trace, chunk)
+
+            final_state = trace[-1]
+        else:
+            # Standard mode without tracing
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        return self._finish_run(trade_date, final_state, instrumentation)
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
@@ -220,6 +303,7 @@ class TradingAgentsGraph:
             },
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
+            "run_metrics": final_state.get("run_metrics"),
         }
 
         # Save to file